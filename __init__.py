@@ -8,6 +8,7 @@ import os  # Standard library for interacting with the operating system
 
 from flask import Flask  # Import Flask class for creating the app
 from flask_sqlalchemy import SQLAlchemy  # Import SQLAlchemy extension for database support
+from jinja2 import FileSystemBytecodeCache  # On-disk cache of compiled templates
 
 db = SQLAlchemy()  # Create a package-level SQLAlchemy extension instance (used for database access throughout the app)
 
@@ -22,6 +23,13 @@ def create_app():  # Factory function to create and configure the Flask app
         static_folder=os.path.join(project_root, "static")        # Set the static folder
     )
 
+    # Reuse compiled template bytecode across worker restarts when a cache directory is configured.
+    # Must be set before app.jinja_env is first used; Jinja already keeps 400 compiled templates in memory.
+    bytecode_cache_dir = os.environ.get("JINJA_BYTECODE_CACHE_DIR")
+    if bytecode_cache_dir:
+        os.makedirs(bytecode_cache_dir, exist_ok=True)
+        app.jinja_options = {**app.jinja_options, "bytecode_cache": FileSystemBytecodeCache(bytecode_cache_dir)}
+
     app.jinja_env.globals['getattr']   = getattr  # Make Python's getattr function available in Jinja templates for dynamic attribute access
     app.jinja_env.globals['attribute'] = getattr  # Alias for getattr in Jinja
 
@@ -31,6 +39,11 @@ def create_app():  # Factory function to create and configure the Flask app
         or f"sqlite:///{os.path.join(project_root, 'dnd_builder.db')}"
     )
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False  # Disable event system for performance
+    app.config["PDF_RENDER_PROCESSES"] = int(os.environ.get("PDF_RENDER_PROCESSES", 0))  # Render PDFs in a process pool (0 = in the request thread)
+    app.config["PDF_CACHE_DIR"] = (  # Private on-disk cache of rendered character sheets
+        os.environ.get("PDF_CACHE_DIR")
+        or os.path.join(app.instance_path, "pdf_cache")
+    )
 
     db.init_app(app)  # Initialize Flask extensions (e.g., SQLAlchemy)
 
@@ -7,6 +7,7 @@
 #
 # ——— Imports ———
 # Standard library imports
+import logging  # Debug output for the creation steps
 import random  # Used for dice rolls and random choices
 from werkzeug.datastructures import MultiDict  # For manipulating form data
 
@@ -14,20 +15,23 @@ from werkzeug.datastructures import MultiDict  # For manipulating form data
 from flask import Blueprint, render_template, request, redirect, url_for, session, flash  # Flask web framework imports
 
 # App-specific imports
-from .forms.equipment_form import EquipmentForm  # Form for equipment selection
-from .data.equipment.weapons import WEAPONS      # Weapon data
-from .data.equipment.armor import ARMOR          # Armor data
+from .forms.equipment_form import EquipmentForm, spell_scroll_choices  # Form for equipment selection
 from .data.equipment import has_weapon_proficiency, has_armor_proficiency  # Proficiency checkers
-from .data.spells import wizard_cantrips, wizard_level1_spells, cleric_cantrips, level1_cleric_spells  # Spell lists
+from .data.spells import wizard_cantrips, wizard_level1_spells, cleric_cantrips, level1_cleric_spells, DISPLAY_LABELS, spell_mask, class_spell_masks  # Spell lists
 from .forms.skills_form import SkillsForm        # Form for skill selection
 from .data.class_skills import CLASS_SKILLS      # Class skill data
 from .utils.spell_utils import calc_spell_save_dc, calc_spell_attack_bonus  # Spell stat calculators
 from .forms.class_form import ClassForm          # Form for class selection
 from .utils.currency_utils import convert_gp_to_coins, format_coin_display  # Currency utilities
+from .utils.armor_utils import calculate_ac      # AC calculation for older session data
+from .utils.skill_utils import calculate_ability_modifiers  # Ability modifiers for the summary
 
 # Create a Flask Blueprint for character-related routes
 bp = Blueprint("characters", __name__, url_prefix="/characters")
 
+# Debug messages are only formatted when DEBUG logging is enabled for this module
+logger = logging.getLogger(__name__)
+
 # ————— Constants —————
 
 # Labels for the six D&D ability scores
@@ -347,7 +351,7 @@ def spell_selection():
     if request.method == "POST":
         # Check if this is actually a form submission
         if 'submit' not in request.form and 'choose_spells' not in request.form:
-            print("DEBUG: No submit button found in form data!")
+            logger.debug("No submit button found in form data!")
         
         cantrips = request.form.getlist("cantrips")
         level1_spells = request.form.getlist("level1_spells")
@@ -377,11 +381,18 @@ def spell_selection():
         
         # Validate spell selections based on class mechanics
         # Both classes select 6 spells at creation for maximum potential
-        if len(parsed_cantrips) != 3:
+        # Selections are packed into bitmasks: bit_count() counts distinct known spells,
+        # and any bit outside the class mask means a spell from another list (or a duplicate/unknown ID).
+        cantrip_options, level1_options = class_spell_masks(char_class)
+        cantrip_mask = spell_mask(parsed_cantrips)
+        level1_mask = spell_mask(parsed_level1_spells)
+        if (cantrip_mask.bit_count() != 3 or cantrip_mask & ~cantrip_options
+                or len(parsed_cantrips) != 3):
             flash("Select exactly 3 cantrips.")
             return redirect(url_for("characters.spell_selection"))
         
-        if len(parsed_level1_spells) != creation_spells:
+        if (level1_mask.bit_count() != creation_spells or level1_mask & ~level1_options
+                or len(parsed_level1_spells) != creation_spells):
             if char_class == "Wizard":
                 flash(f"Select exactly 3 cantrips and {creation_spells} first-level spells for your spellbook.")
             else:  # Cleric
@@ -400,7 +411,6 @@ def spell_selection():
 
     # Get appropriate spell lists and class-specific context
     if char_class == "Wizard":
-        from .data.spells import wizard_cantrips, wizard_level1_spells
         context = {
             "cantrips": wizard_cantrips,
             "level1_spells": wizard_level1_spells,
@@ -428,18 +438,19 @@ def spell_selection():
 @bp.route("/step5_equipment", methods=["GET", "POST"])
 def step5_equipment():
     """Fifth step: Select equipment, weapons, and armor."""
-    if request.method == "POST":
-        print(f"DEBUG: Equipment POST request received")
-        print(f"DEBUG: All form keys: {list(request.form.keys())}")
-        print(f"DEBUG: Form data: {dict(request.form)}")
+    # The arguments below copy the whole form, so only build them when debug logging is on
+    if request.method == "POST" and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Equipment POST request received")
+        logger.debug("All form keys: %s", list(request.form.keys()))
+        logger.debug("Form data: %s", dict(request.form))
     
     # Get character info from session
     char_class = session.get("class")
     if not char_class:
-        print("DEBUG: No character class in session, redirecting")
+        logger.debug("No character class in session, redirecting")
         return redirect(url_for("characters.step3_class"))
     
-    print(f"DEBUG: Equipment step - Class is: {char_class}")
+    logger.debug("Equipment step - Class is: %s", char_class)
 
     # Clear equipment data if coming from a previous step
     if request.method == "GET" and request.referrer and 'step4_skills' in request.referrer:
@@ -465,7 +476,7 @@ def step5_equipment():
     
     coins_left = session.get("coins_left")
     budget_gp = coins_left.get("gp", starting_gp)
-    print(f"DEBUG: Starting budget: {budget_gp}gp")
+    logger.debug("Starting budget: %sgp", budget_gp)
 
     # Set default values for GET request
     remaining_funds = budget_gp
@@ -483,7 +494,7 @@ def step5_equipment():
     
     # Set form properties
     form.char_class = char_class
-    print(f"DEBUG: Set form budget to: {form.budget.data}")
+    logger.debug("Set form budget to: %s", form.budget.data)
     
     # Set up spell choices for spell scrolls based on class and level
     if request.method == 'POST':
@@ -493,23 +504,8 @@ def step5_equipment():
         level = '0'
         spell_class = 'wizard'
     
-    # Get appropriate spell list
-    from .data.spells import (wizard_cantrips, wizard_level1_spells,
-                            cleric_cantrips, level1_cleric_spells)
-    
-    if spell_class == 'wizard':
-        spells = wizard_cantrips if level == '0' else wizard_level1_spells
-    else:
-        if level == '0':
-            # Cleric cantrips have 3 elements, extract first 2
-            spells = [(spell[0], spell[1]) for spell in cleric_cantrips]
-        else:
-            spells = level1_cleric_spells
-    
-    # Update spell selection choices
-    form.special_equipment.spell_selection.choices = [
-        (spell_id, spell_name) for spell_id, spell_name in spells
-    ]
+    # Share the priced choices built once at import (no per-request list)
+    form.special_equipment.spell_selection.choices = spell_scroll_choices(spell_class, level)
 
     # Initialize equipment for both GET and POST
     equipment = {
@@ -521,19 +517,19 @@ def step5_equipment():
     }
     
     if request.method == 'POST':
-        print(f"DEBUG: POST request received")
-        print(f"DEBUG: Form data: {request.form}")
-        print(f"DEBUG: CSRF token present: {'csrf_token' in request.form}")
+        logger.debug("POST request received")
+        logger.debug("Form data: %s", request.form)
+        logger.debug("CSRF token present: %s", 'csrf_token' in request.form)
         
         # Ensure budget is set before validation
-        print(f"DEBUG: Form budget before validation: {form.budget.data}")
+        logger.debug("Form budget before validation: %s", form.budget.data)
         if not form.budget.data:
             form.budget.data = str(budget_gp)
-            print(f"DEBUG: Set form budget to: {form.budget.data}")
+            logger.debug("Set form budget to: %s", form.budget.data)
         
         # Check if this is a special equipment toggle request
         if request.form.get('action') == 'toggle_special':
-            print(f"DEBUG: Toggling special equipment visibility")
+            logger.debug("Toggling special equipment visibility")
             
             # Create a new form instance with preserved data to maintain state
             preserved_form = EquipmentForm(formdata=request.form)
@@ -552,7 +548,7 @@ def step5_equipment():
         
         # Check if this is a spell list update request
         if request.form.get('action') == 'update_spells':
-            print(f"DEBUG: Updating spell choices")
+            logger.debug("Updating spell choices")
             
             # Preserve all current form selections
             form_data = request.form.to_dict(flat=False)
@@ -566,34 +562,17 @@ def step5_equipment():
             if request.form.get('special_equipment-has_spell_scroll'):
                 preserved_form.special_equipment.has_spell_scroll.data = True
             
-            print(f"DEBUG: Spell scroll checkbox state: {preserved_form.special_equipment.has_spell_scroll.data}")
+            logger.debug("Spell scroll checkbox state: %s", preserved_form.special_equipment.has_spell_scroll.data)
             
             # Update spell selection choices based on current class and level
             spell_class = preserved_form.special_equipment.spell_scroll_class.data or 'wizard'
             spell_level = preserved_form.special_equipment.spell_scroll_level.data or '0'
             
-            from .data.spells import (wizard_cantrips, wizard_level1_spells,
-                                     cleric_cantrips, level1_cleric_spells)
-            
-            def get_spell_choices(spell_class, level):
-                if spell_class == 'wizard':
-                    return wizard_cantrips if level == '0' else wizard_level1_spells
-                elif spell_class == 'cleric':
-                    if level == '0':
-                        # Cleric cantrips have 3 elements, extract first 2
-                        return [(spell[0], spell[1]) for spell in cleric_cantrips]
-                    else:
-                        return level1_cleric_spells
-                return []
+            # Priced spell choices come from the table EquipmentForm builds at import
+            choices = spell_scroll_choices(spell_class, spell_level)
+            preserved_form.special_equipment.spell_selection.choices = choices
             
-            spell_list = get_spell_choices(spell_class, spell_level)
-            # Add pricing to spell choices
-            spell_price = 30 if spell_level == '0' else 50  # 30gp for cantrips, 50gp for 1st level
-            preserved_form.special_equipment.spell_selection.choices = [('', '-- Select Spell --')] + [
-                (key, f"{name} ({spell_price} gp)") for key, name in spell_list
-            ]
-            
-            print(f"DEBUG: Updated spell choices for {spell_class} level {spell_level}: {len(spell_list)} spells")
+            logger.debug("Updated spell choices for %s level %s: %s spells", spell_class, spell_level, len(choices) - 1)
             
             # Re-render the form with updated spell choices and preserved state
             remaining_coins = convert_gp_to_coins(budget_gp)
@@ -607,26 +586,28 @@ def step5_equipment():
         
         # Validate form
         form.equipment_check.data = "check"  # Trigger equipment validation
-        print(f"DEBUG: About to validate form...")
+        logger.debug("About to validate form...")
         
-        # Check each field for errors before validation
-        for field_name, field in form._fields.items():
-            if hasattr(field, 'data'):
-                print(f"DEBUG: Field {field_name}: data={field.data}, raw_data={getattr(field, 'raw_data', None)}")
+        # Log each field's data before validation (skipped entirely unless debug logging is on)
+        if logger.isEnabledFor(logging.DEBUG):
+            for field_name, field in form._fields.items():
+                if hasattr(field, 'data'):
+                    logger.debug("Field %s: data=%s, raw_data=%s", field_name, field.data, getattr(field, 'raw_data', None))
         
         is_valid = form.validate()
-        print(f"DEBUG: Form validation result: {is_valid}")
+        logger.debug("Form validation result: %s", is_valid)
         
-        # Check for field errors after validation
-        for field_name, field in form._fields.items():
-            if field.errors:
-                print(f"DEBUG: Field {field_name} has errors: {field.errors}")
+        # Log field errors after validation
+        if logger.isEnabledFor(logging.DEBUG):
+            for field_name, field in form._fields.items():
+                if field.errors:
+                    logger.debug("Field %s has errors: %s", field_name, field.errors)
         
-        print(f"DEBUG: Form validation errors: {getattr(form, 'validation_errors', [])}")
-        print(f"DEBUG: Form field errors: {form.errors}")
+        logger.debug("Form validation errors: %s", getattr(form, 'validation_errors', []))
+        logger.debug("Form field errors: %s", form.errors)
         
         if is_valid:
-            print("DEBUG: Form validated successfully")
+            logger.debug("Form validated successfully")
             
             # Calculate costs in gold pieces
             total_cost_gp = form.calculate_total_cost()  # in gold pieces
@@ -640,8 +621,8 @@ def step5_equipment():
             total_cost_str = format_coin_display(total_coins)
             remaining_funds_str = format_coin_display(remaining_coins)
             
-            print(f"DEBUG: Total cost: {total_cost_str}")
-            print(f"DEBUG: Remaining: {remaining_funds_str}")
+            logger.debug("Total cost: %s", total_cost_str)
+            logger.debug("Remaining: %s", remaining_funds_str)
             
             # Store the remaining funds in the session
             session['coins_left'] = remaining_coins
@@ -705,7 +686,9 @@ def step5_equipment():
                     # Store equipment and update funds
                     session['equipment'] = equipment
                     session['coins_left'] = remaining_coins
-                    print(f"DEBUG: Purchase completed. Starting: {budget_gp}gp, Cost: {total_cost}gp, Remaining: {format_coin_display(remaining_coins)}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Purchase completed. Starting: %sgp, Cost: %sgp, Remaining: %s",
+                                     budget_gp, total_cost, format_coin_display(remaining_coins))
                     
                     # Flash warnings about unusable items
                     if equipment['unusable_items']:
@@ -727,9 +710,9 @@ def step5_equipment():
                                         equipment=equipment,
                                         format_coin_display=format_coin_display)
         else:
-            print("DEBUG: Form validation failed")
-            print(f"DEBUG: Form validation errors: {getattr(form, 'validation_errors', [])}")
-            print(f"DEBUG: Form field errors: {form.errors}")
+            logger.debug("Form validation failed")
+            logger.debug("Form validation errors: %s", getattr(form, 'validation_errors', []))
+            logger.debug("Form field errors: %s", form.errors)
             # Re-render the form with errors
             for error in getattr(form, 'validation_errors', []):
                 flash(error)
@@ -741,42 +724,6 @@ def step5_equipment():
                                 remaining_funds=form.remaining_funds if hasattr(form, 'remaining_funds') else budget_gp,  # Add this for template compatibility
                                 equipment=equipment,
                                 format_coin_display=format_coin_display)
-            
-            # Process armor selection
-            if form.armor.data:
-                category, name = form.armor.data.split(':')
-                armor_item = next((a for a in ARMOR[category] if a['name'] == name), None)
-                if armor_item:
-                    armor_item = {**armor_item, 'add_dex': category in ['light', 'medium']}
-                    if category == 'medium':
-                        armor_item['max_dex'] = 2
-                    elif category == 'light':
-                        armor_item['max_dex'] = None
-                    equipment['armor'] = armor_item
-                    # Update AC based on armor
-                    equipment['armor_class'] = armor_item['ac']
-                    if armor_item['add_dex']:
-                        max_dex = armor_item.get('max_dex')
-                        if max_dex is not None:
-                            equipment['armor_class'] += min(dex_mod, max_dex)
-                        else:
-                            equipment['armor_class'] += dex_mod
-            
-            # Process shield selection
-            if form.shield.data:
-                shield_item = ARMOR['shield'][0]  # There's only one shield
-                if shield_item:
-                    equipment['shield'] = shield_item
-                    equipment['armor_class'] += shield_item['ac_bonus']
-
-            # Process weapon selections
-            for field in [form.simple_melee, form.simple_ranged, form.martial_melee, form.martial_ranged]:
-                for weapon_data in field.data:
-                    if weapon_data:
-                        category, name = weapon_data.split(':')
-                        weapon_item = next((w for w in WEAPONS[category] if w['name'] == name), None)
-                        if weapon_item:
-                            equipment['weapons'].append({'category': category, 'name': name, **weapon_item})
 
     # For initial load, set up initial coins with full budget
     remaining_coins = convert_gp_to_coins(budget_gp)
@@ -840,10 +787,7 @@ def step6_summary():
         spell_attack_bonus = calc_spell_attack_bonus(cast_mod, prof_bonus)
 
     # Calculate ability modifiers
-    ability_mods = {
-        abbr: (score - 10) // 2
-        for abbr, score in stats.items()
-    }
+    ability_mods = dict(zip(stats, calculate_ability_modifiers(stats.values())))
 
     # Get equipment from session
     equipment = session.get("equipment", {
@@ -856,7 +800,6 @@ def step6_summary():
 
     # If AC hasn't been calculated (e.g., old session data)
     if 'armor_class' not in equipment:
-        from .utils.armor_utils import calculate_ac
         equipment['armor_class'] = calculate_ac(
             armor=equipment.get('armor'),
             shield=equipment.get('shield'),
@@ -875,10 +818,10 @@ def step6_summary():
     # Fallback: if skill_proficiencies is missing, try to use any available skills
     profs = set(session.get("skill_proficiencies") or session.get("skills") or [])
     expertise = set(session.get("expertise", []))
-    print(f"DEBUG STATS: {stats}")
-    print(f"DEBUG ABILITY_MODS: {ability_mods}")
-    print(f"DEBUG PROFS: {profs}")
-    print(f"DEBUG EXPERTISE: {expertise}")
+    logger.debug("STATS: %s", stats)
+    logger.debug("ABILITY_MODS: %s", ability_mods)
+    logger.debug("PROFS: %s", profs)
+    logger.debug("EXPERTISE: %s", expertise)
     skills_list = []
     for skill, abbr in SKILL_ABILITIES.items():
         is_prof = skill in profs
@@ -887,7 +830,7 @@ def step6_summary():
         # Expertise doubles proficiency bonus
         prof_modifier = prof_bonus * 2 if has_expertise else prof_bonus if is_prof else 0
         total_mod = base_mod + prof_modifier
-        print(f"DEBUG SKILL: {skill} | Ability: {abbr} | base_mod: {base_mod} | Proficient: {is_prof} | Expertise: {has_expertise} | prof_bonus: {prof_bonus} | prof_modifier: {prof_modifier} | total_mod: {total_mod}")
+        logger.debug("SKILL: %s | Ability: %s | base_mod: %s | Proficient: %s | Expertise: %s | prof_bonus: %s | prof_modifier: %s | total_mod: %s", skill, abbr, base_mod, is_prof, has_expertise, prof_bonus, prof_modifier, total_mod)
         skills_list.append({
             "name": skill,
             "ability": abbr[:3].upper(),  # Just use first 3 letters for display
@@ -901,8 +844,6 @@ def step6_summary():
     passive_perception = 10 + ability_mods['wisdom'] + (prof_bonus if perception_prof else 0)
 
     # Check weapon proficiencies for attack bonus calculations
-    from .data.equipment import has_weapon_proficiency
-    
     # Check if character is proficient with any melee/ranged weapons
     melee_proficient = False
     ranged_proficient = False
@@ -927,27 +868,9 @@ def step6_summary():
     if has_weapon_proficiency(char_class, 'simple_ranged') or has_weapon_proficiency(char_class, 'martial_ranged'):
         ranged_proficient = True
 
-    # Create spell lookup dictionaries
-    def create_spell_lookup():
-        lookup = {}
-        # Add wizard spells (2-tuple format: id, name)
-        for spell_id, spell_name in wizard_cantrips + wizard_level1_spells:
-            lookup[spell_id] = spell_name
-        # Add cleric cantrips (3-tuple format: id, name, concentration)
-        for spell_data in cleric_cantrips:
-            if len(spell_data) == 3:
-                spell_id, spell_name, concentration = spell_data
-                lookup[spell_id] = spell_name
-            else:
-                spell_id, spell_name = spell_data
-                lookup[spell_id] = spell_name
-        # Add level 1 cleric spells (2-tuple format: id, name)
-        for spell_id, spell_name in level1_cleric_spells:
-            lookup[spell_id] = spell_name
-        return lookup
-    
-    spell_lookup = create_spell_lookup()
-    
+    # Spell ID -> display name lookup (built once at import in data/spells.py)
+    spell_lookup = DISPLAY_LABELS
+
     # Convert stored spell IDs back to names for display
     cantrip_names = []
     for cantrip_data in session.get("cantrips", []):
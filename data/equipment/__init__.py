@@ -21,6 +21,13 @@ CLASS_PROFICIENCIES = {
     }
 }
 
+# Proficiencies as frozensets per class, built once at import: every check is a hash lookup
+_ARMOR_PROFICIENCIES = {cls: frozenset(profs["armor"]) for cls, profs in CLASS_PROFICIENCIES.items()}
+_WEAPON_PROFICIENCIES = {cls: frozenset(profs["weapons"]) for cls, profs in CLASS_PROFICIENCIES.items()}
+
+# Weapon name -> (WEAPONS category, weapon dict), to find a weapon's category without scanning
+_WEAPONS_BY_NAME = {weapon["name"]: (cat, weapon) for cat, weapons in WEAPONS.items() for weapon in weapons}
+
 # Function to check if a class has proficiency with a given armor type
 def has_armor_proficiency(char_class: str, armor_type: str) -> bool:
     """
@@ -33,7 +40,7 @@ def has_armor_proficiency(char_class: str, armor_type: str) -> bool:
     """
     if not char_class:
         return False  # No class provided
-    return armor_type in CLASS_PROFICIENCIES.get(char_class, {}).get("armor", [])
+    return armor_type in _ARMOR_PROFICIENCIES.get(char_class, ())
 
 # Function to check if a class has proficiency with a given weapon or weapon category
 def has_weapon_proficiency(char_class: str, weapon_info: str | dict) -> bool:
@@ -48,17 +55,15 @@ def has_weapon_proficiency(char_class: str, weapon_info: str | dict) -> bool:
     """
     if not char_class:
         return False  # No class provided
-    proficiencies = CLASS_PROFICIENCIES.get(char_class, {}).get("weapons", [])
+    proficiencies = _WEAPON_PROFICIENCIES.get(char_class, ())
     # If we're checking a category (e.g., 'simple_melee')
     if isinstance(weapon_info, str):
         return weapon_info in proficiencies
     # If we're checking a specific weapon (dict)
-    # First check if they have proficiency with the whole category
-    weapon_cat = None
-    for cat in ['simple_melee', 'simple_ranged', 'martial_melee', 'martial_ranged']:
-        if weapon_info in WEAPONS[cat]:
-            weapon_cat = cat
-            break
+    # First check if they have proficiency with the whole category (only for an actual catalog weapon)
+    weapon_cat, catalog_weapon = _WEAPONS_BY_NAME.get(weapon_info.get('name'), (None, None))
+    if catalog_weapon != weapon_info:
+        weapon_cat = None
     if weapon_cat and weapon_cat in proficiencies:
         return True  # Proficient with the whole category
     # Check for specific weapon proficiencies (e.g., 'rapier')
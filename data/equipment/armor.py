@@ -2,6 +2,8 @@
 # This module defines all armor and shield options for the D&D character builder.
 # Each armor type is represented as a list of dictionaries with stats and properties.
 
+from typing import NamedTuple
+
 ARMOR = {
     "light": [
         # Light armor options: allow full Dexterity bonus, low weight
@@ -148,3 +150,20 @@ ARMOR = {
 }
 
 # This dictionary is used to populate armor selection forms, validate choices, and calculate AC and encumbrance.
+
+# Flat, typed view of ARMOR for building form choices: one row per armor or shield,
+# built once at import so callers read attributes instead of chaining dict lookups
+class ArmorRow(NamedTuple):
+    category: str      # 'light', 'medium', 'heavy' or 'shield'
+    name: str
+    ac: int | None     # Base AC (None for shields)
+    ac_bonus: int      # AC a shield adds (0 for armor)
+    cost_gp: int
+    cost_sp: int
+    cost_cp: int
+
+ARMOR_ROWS = tuple(
+    ArmorRow(category, item['name'], item.get('ac'), item.get('ac_bonus', 0),
+             item['cost'].get('gp', 0), item['cost'].get('sp', 0), item['cost'].get('cp', 0))
+    for category, items in ARMOR.items() for item in items if isinstance(item, dict)
+)
@@ -2,6 +2,8 @@
 # This module defines all weapon options for the D&D character builder.
 # Each weapon type is represented as a list of dictionaries with stats and properties.
 
+from typing import NamedTuple
+
 WEAPONS = {
     "simple_melee": [
         # Simple melee weapons: easy to use, available to most classes
@@ -355,3 +357,20 @@ WEAPONS = {
 
 # Each weapon entry includes name, cost, damage, damage type, weight, properties, and category.
 # This dictionary is used to populate weapon selection forms, validate choices, and calculate attack/damage stats.
+
+# Flat, typed view of WEAPONS for building form choices: one row per weapon, built once at import
+class WeaponRow(NamedTuple):
+    category: str      # WEAPONS key, e.g. 'simple_melee'
+    name: str
+    damage: str
+    damage_type: str
+    cost_gp: int
+    cost_sp: int
+    cost_cp: int
+
+WEAPON_ROWS = tuple(
+    WeaponRow(category, weapon['name'], weapon['damage'], weapon['damage_type'],
+              weapon.get('cost', {}).get('gp', 0), weapon.get('cost', {}).get('sp', 0),
+              weapon.get('cost', {}).get('cp', 0))
+    for category, weapons in WEAPONS.items() for weapon in weapons
+)
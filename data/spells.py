@@ -2,99 +2,199 @@
 # This module defines all available spells for Wizards and Clerics, including cantrips and 1st-level spells.
 # The spell lists are used to populate spell selection forms and validate spellbook/cantrip choices.
 
+# ————— Spell Registry —————
+# Canonical display label for every spell, keyed by spell ID.
+# Labels are stored clean; the "(Concentration)" tag is added by spell_label() when displayed.
+# Spells shared between classes (Light, Mending, Detect Magic, ...) are listed once here,
+# so a label only ever needs updating in one place.
+SPELL_LABELS = {
+    # Wizard cantrips
+    "acid_splash":                   "Acid Splash",
+    "blade_ward":                    "Blade Ward",
+    "chill_touch":                   "Chill Touch",
+    "dancing_lights":                "Dancing Lights",
+    "elementalism":                  "Elementalism",
+    "fire_bolt":                     "Fire Bolt",
+    "friends":                       "Friends",
+    "light":                         "Light",
+    "mage_hand":                     "Mage Hand",
+    "mending":                       "Mending",
+    "message":                       "Message",
+    "mind_sliver":                   "Mind Sliver",
+    "minor_illusion":                "Minor Illusion",
+    "poison_spray":                  "Poison Spray",
+    "prestidigitation":              "Prestidigitation",
+    "ray_of_frost":                  "Ray of Frost",
+    "shocking_grasp":                "Shocking Grasp",
+    "thunderclap":                   "Thunderclap",
+    "toll_the_dead":                 "Toll the Dead",
+    "true_strike":                   "True Strike",
+    # Wizard 1st-level spells
+    "alarm":                         "Alarm",
+    "burning_hands":                 "Burning Hands",
+    "charm_person":                  "Charm Person",
+    "chromatic_orb":                 "Chromatic Orb",
+    "color_spray":                   "Color Spray",
+    "comprehend_languages":          "Comprehend Languages",
+    "detect_magic":                  "Detect Magic",
+    "disguise_self":                 "Disguise Self",
+    "expeditious_retreat":           "Expeditious Retreat",
+    "false_life":                    "False Life",
+    "feather_fall":                  "Feather Fall",
+    "find_familiar":                 "Find Familiar",
+    "fog_cloud":                     "Fog Cloud",
+    "grease":                        "Grease",
+    "ice_knife":                     "Ice Knife",
+    "identify":                      "Identify",
+    "illusory_script":               "Illusory Script",
+    "jump":                          "Jump",
+    "longstrider":                   "Longstrider",
+    "mage_armor":                    "Mage Armor",
+    "magic_missile":                 "Magic Missile",
+    "protection_from_evil_and_good": "Protection from Evil and Good",
+    "ray_of_sickness":               "Ray of Sickness",
+    "shield":                        "Shield",
+    "silent_image":                  "Silent Image",
+    "sleep":                         "Sleep",
+    "tashas_hideous_laughter":       "Tasha's Hideous Laughter",
+    "tensers_floating_disk":         "Tenser's Floating Disk",
+    "thunderwave":                   "Thunderwave",
+    "unseen_servant":                "Unseen Servant",
+    "witch_bolt":                    "Witch Bolt",
+    # Cleric cantrips (not already listed above)
+    "guidance":                      "Guidance",
+    "resistance":                    "Resistance",
+    "sacred_flame":                  "Sacred Flame",
+    "spare_the_dying":               "Spare the Dying",
+    "thaumaturgy":                   "Thaumaturgy",
+    "word_of_radiance":              "Word of Radiance",
+    # Cleric 1st-level spells (not already listed above)
+    "bane":                          "Bane",
+    "bless":                         "Bless",
+    "command":                       "Command",
+    "create_or_destroy_water":       "Create or Destroy Water",
+    "cure_wounds":                   "Cure Wounds",
+    "detect_evil_and_good":          "Detect Evil and Good",
+    "detect_poison_and_disease":     "Detect Poison and Disease",
+    "guiding_bolt":                  "Guiding Bolt",
+    "healing_word":                  "Healing Word",
+    "inflict_wounds":                "Inflict Wounds",
+    "purify_food_and_drink":         "Purify Food and Drink",
+    "sanctuary":                     "Sanctuary",
+    "shield_of_faith":               "Shield of Faith",
+}
+
 # ————— Wizard Spells —————
-wizard_cantrips = [
-    # (key, label) tuples for each cantrip
-    ("acid_splash",     "Acid Splash"),
-    ("blade_ward",      "Blade Ward (Concentration)"),
-    ("chill_touch",     "Chill Touch"),
-    ("dancing_lights",  "Dancing Lights (Concentration)"),
-    ("elementalism",    "Elementalism"),
-    ("fire_bolt",       "Fire Bolt"),
-    ("friends",         "Friends (Concentration)"),
-    ("light",           "Light"),
-    ("mage_hand",       "Mage Hand"),
-    ("mending",         "Mending"),
-    ("message",         "Message"),
-    ("mind_sliver",     "Mind Sliver"),
-    ("minor_illusion",  "Minor Illusion"),
-    ("poison_spray",    "Poison Spray"),
-    ("prestidigitation","Prestidigitation"),
-    ("ray_of_frost",    "Ray of Frost"),
-    ("shocking_grasp",  "Shocking Grasp"),
-    ("thunderclap",     "Thunderclap"),
-    ("toll_the_dead",   "Toll the Dead"),
-    ("true_strike",     "True Strike"),
-]
+# Ordered spell IDs for each cantrip; labels come from SPELL_LABELS
+WIZARD_CANTRIP_KEYS = (
+    "acid_splash", "blade_ward", "chill_touch", "dancing_lights", "elementalism",
+    "fire_bolt", "friends", "light", "mage_hand", "mending",
+    "message", "mind_sliver", "minor_illusion", "poison_spray", "prestidigitation",
+    "ray_of_frost", "shocking_grasp", "thunderclap", "toll_the_dead", "true_strike",
+)
 
 # ————— 1st-Level Wizard Spells —————
-wizard_level1_spells = [
-    # (key, label) tuples for each 1st-level spell
-    ("alarm",                          "Alarm"),
-    ("burning_hands",                  "Burning Hands"),
-    ("charm_person",                   "Charm Person"),
-    ("chromatic_orb",                  "Chromatic Orb"),
-    ("color_spray",                    "Color Spray"),
-    ("comprehend_languages",           "Comprehend Languages"),
-    ("detect_magic",                   "Detect Magic"),
-    ("disguise_self",                  "Disguise Self"),
-    ("expeditious_retreat",            "Expeditious Retreat"),
-    ("false_life",                     "False Life"),
-    ("feather_fall",                   "Feather Fall"),
-    ("find_familiar",                  "Find Familiar"),
-    ("fog_cloud",                      "Fog Cloud"),
-    ("grease",                         "Grease"),
-    ("ice_knife",                      "Ice Knife"),
-    ("identify",                       "Identify"),
-    ("illusory_script",                "Illusory Script"),
-    ("jump",                           "Jump"),
-    ("longstrider",                    "Longstrider"),
-    ("mage_armor",                     "Mage Armor"),
-    ("magic_missile",                  "Magic Missile"),
-    ("protection_from_evil_and_good",  "Protection from Evil and Good"),
-    ("ray_of_sickness",                "Ray of Sickness"),
-    ("shield",                         "Shield"),
-    ("silent_image",                   "Silent Image"),
-    ("sleep",                          "Sleep"),
-    ("tashas_hideous_laughter",        "Tasha's Hideous Laughter"),
-    ("tensers_floating_disk",          "Tenser's Floating Disk"),
-    ("thunderwave",                    "Thunderwave"),
-    ("unseen_servant",                 "Unseen Servant"),
-    ("witch_bolt",                     "Witch Bolt"),
-]
+# Ordered spell IDs for each 1st-level spell
+WIZARD_LEVEL1_KEYS = (
+    "alarm", "burning_hands", "charm_person", "chromatic_orb", "color_spray",
+    "comprehend_languages", "detect_magic", "disguise_self", "expeditious_retreat", "false_life",
+    "feather_fall", "find_familiar", "fog_cloud", "grease", "ice_knife",
+    "identify", "illusory_script", "jump", "longstrider", "mage_armor",
+    "magic_missile", "protection_from_evil_and_good", "ray_of_sickness", "shield", "silent_image",
+    "sleep", "tashas_hideous_laughter", "tensers_floating_disk", "thunderwave", "unseen_servant",
+    "witch_bolt",
+)
 
 # ————— Cleric Cantrips —————
-# (key, label, requires_concentration)
-cleric_cantrips = [
-    ("guidance",          "Guidance",          True),
-    ("light",             "Light",             False),
-    ("mending",           "Mending",           False),
-    ("resistance",        "Resistance",        True),
-    ("sacred_flame",      "Sacred Flame",      False),
-    ("spare_the_dying",   "Spare the Dying",   False),
-    ("thaumaturgy",       "Thaumaturgy",       False),
-    ("toll_the_dead",     "Toll the Dead",     False),
-    ("word_of_radiance",  "Word of Radiance",  False),
-]
+CLERIC_CANTRIP_KEYS = (
+    "guidance", "light", "mending", "resistance", "sacred_flame",
+    "spare_the_dying", "thaumaturgy", "toll_the_dead", "word_of_radiance",
+)
 
 # ————— 1st-Level Cleric Spells —————
-level1_cleric_spells = [
-    ("bane",                          "Bane"),
-    ("bless",                         "Bless"),
-    ("command",                       "Command"),
-    ("create_or_destroy_water",       "Create or Destroy Water"),
-    ("cure_wounds",                   "Cure Wounds"),
-    ("detect_evil_and_good",          "Detect Evil and Good"),
-    ("detect_magic",                  "Detect Magic"),
-    ("detect_poison_and_disease",     "Detect Poison and Disease"),
-    ("guiding_bolt",                  "Guiding Bolt"),
-    ("healing_word",                  "Healing Word"),
-    ("inflict_wounds",                "Inflict Wounds"),
-    ("protection_from_evil_and_good", "Protection from Evil and Good"),
-    ("purify_food_and_drink",         "Purify Food and Drink"),
-    ("sanctuary",                     "Sanctuary"),
-    ("shield_of_faith",               "Shield of Faith"),
-]
+CLERIC_LEVEL1_KEYS = (
+    "bane", "bless", "command", "create_or_destroy_water", "cure_wounds",
+    "detect_evil_and_good", "detect_magic", "detect_poison_and_disease", "guiding_bolt", "healing_word",
+    "inflict_wounds", "protection_from_evil_and_good", "purify_food_and_drink", "sanctuary", "shield_of_faith",
+)
+
+# ————— Concentration —————
+# Spells that require concentration, for every class
+CONCENTRATION_SPELLS = frozenset({
+    "blade_ward", "dancing_lights", "friends",  # Wizard cantrips
+    "guidance", "resistance",                   # Cleric cantrips
+})
+
+def spell_label(key, default=None):
+    """
+    Return the display label for a spell, tagging spells that require concentration.
+    Args:
+        key (str): The spell ID (e.g., 'blade_ward')
+        default: Value returned when the spell ID is unknown
+    Returns:
+        str: The label, e.g. 'Blade Ward (Concentration)'
+    """
+    label = SPELL_LABELS.get(key)
+    if label is None:
+        return default
+    return f"{label} (Concentration)" if key in CONCENTRATION_SPELLS else label
+
+# ————— Integer Spell IDs —————
+# Each spell gets a compact integer index (registry order) so a set of known spells
+# packs into a single int bitmask: membership is one bit test, counting is bit_count().
+# Shared (index, spell ID, label) rows, indexed by the spell's integer ID
+SPELL_TABLE = tuple((index, key, label) for index, (key, label) in enumerate(SPELL_LABELS.items()))
+
+# Spell ID -> integer index, the reverse of SPELL_TABLE
+_SPELL_INDICES = {key: index for index, key, _ in SPELL_TABLE}
+
+def spell_mask(keys):
+    """
+    Pack spell IDs into an int bitmask.
+    Args:
+        keys (iterable): Spell IDs (e.g., ['fire_bolt', 'light'])
+    Returns:
+        int: Bitmask with one bit set per known spell; unknown IDs are skipped
+    """
+    mask = 0
+    for key in keys:
+        index = _SPELL_INDICES.get(key)
+        if index is not None:
+            mask |= 1 << index
+    return mask
+
+def knows_spell(mask, key):
+    """Return True if the spell ID's bit is set in the mask."""
+    index = _SPELL_INDICES.get(key)
+    return index is not None and bool((mask >> index) & 1)
+
+# Class -> (cantrip mask, 1st-level mask) of the spells it may choose
+_CLASS_SPELL_MASKS = {
+    "Wizard": (spell_mask(WIZARD_CANTRIP_KEYS), spell_mask(WIZARD_LEVEL1_KEYS)),
+    "Cleric": (spell_mask(CLERIC_CANTRIP_KEYS), spell_mask(CLERIC_LEVEL1_KEYS)),
+}
+
+def class_spell_masks(char_class):
+    """
+    Return (cantrip mask, 1st-level mask) of the spells a class may choose.
+    Args:
+        char_class (str): 'Wizard' or 'Cleric'
+    Returns:
+        tuple: (int, int) bitmasks; (0, 0) for classes without spells
+    """
+    return _CLASS_SPELL_MASKS.get(char_class, (0, 0))
+
+# ————— (key, label) Lists —————
+# Built from the registry; forms and templates import these names directly.
+# Wizard cantrip labels carry the concentration tag; cleric cantrips keep it as a separate flag.
+wizard_cantrips = tuple((key, spell_label(key)) for key in WIZARD_CANTRIP_KEYS)
+wizard_level1_spells = tuple((key, SPELL_LABELS[key]) for key in WIZARD_LEVEL1_KEYS)
+# (key, label, requires_concentration)
+cleric_cantrips = tuple((key, SPELL_LABELS[key], key in CONCENTRATION_SPELLS) for key in CLERIC_CANTRIP_KEYS)
+level1_cleric_spells = tuple((key, SPELL_LABELS[key]) for key in CLERIC_LEVEL1_KEYS)
+
+# Spell ID -> label exactly as the lists above show it (the summary page's lookup)
+DISPLAY_LABELS = {**SPELL_LABELS, **dict(wizard_cantrips)}
 
 # Each spell list is used to populate spell selection forms and enforce class-specific spell rules.
 # The cantrip lists may include a concentration flag for UI/validation purposes.
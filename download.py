@@ -3,57 +3,467 @@
 # -----------------------
 # This module handles PDF generation and download for the D&D Character Builder app.
 # It uses ReportLab to create a detailed character sheet PDF from session data.
+# _render_pdf() does the rendering; the download_pdf route only sends the result.
 #
 # Each section, function, and block is now commented in detail for clarity and maintainability.
 #
 # ——— Imports ———
+import hashlib  # ETag digests
 import io  # For in-memory byte buffer
-from flask import Blueprint, session, send_file  # Flask utilities for routing, session, and file sending
+import json  # Canonical serialization of the character data for ETags
+import os  # PDF disk cache files
+import tempfile  # Atomic writes into the PDF disk cache
+import threading  # Per-thread PDF buffer
+from functools import lru_cache  # Per-class feature lookups
+from concurrent.futures import ProcessPoolExecutor  # Optional off-thread PDF rendering
+from flask import Blueprint, Response, abort, current_app, request, send_file, session  # Flask utilities for routing, session, and responses
 from reportlab.lib import colors  # Color constants for PDF styling
 from reportlab.lib.pagesizes import letter  # Standard US letter page size
-from reportlab.platypus import Table, TableStyle  # Table and style classes for PDF layout
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle  # Paragraph style sheet
+from reportlab.lib.units import inch  # Unit conversion for layout
+from reportlab.platypus import (  # PDF layout building blocks
+    BaseDocTemplate, PageTemplate, Frame, FrameBreak, NextPageTemplate,
+    Table, TableStyle, Paragraph, Spacer, PageBreak, Flowable, HRFlowable
+)
+
+from .utils.currency_utils import format_coin_display  # Remaining funds formatting
+from .utils.skill_utils import calculate_ability_modifiers  # Ability modifiers for the score grid
 
 
 # Create a Flask Blueprint for download-related routes
 bp = Blueprint("download", __name__)
 
-@bp.route("/download/pdf")
-def download_pdf():
+# ——— Palette ———
+# Sheet colors, parsed once at import and shared by styles, tables and flowables
+_INK       = colors.HexColor('#2c1810')  # Dark brown text
+_PARCHMENT = colors.HexColor('#e8dcc0')  # Alternate row / modifier background
+_GOLD      = colors.HexColor('#d4af37')  # Header and funds background
+_LEATHER   = colors.HexColor('#8b4513')  # Grid lines, borders and rules
+_CREAM     = colors.HexColor('#f4f1e8')  # Table body background
+_INDIGO    = colors.HexColor('#4b0082')  # Spellcasting accents
+_LAVENDER  = colors.HexColor('#e6e6fa')  # Spellcasting text and fills
+_PALE_BLUE = colors.HexColor('#f0f0ff')  # Spell list background
+
+# ——— Styles ———
+def _build_styles():
     """
-    Generate and send a PDF character sheet based on session data.
-    This function builds a detailed PDF using ReportLab, including all character info, stats, equipment, spells, and more.
+    Build the ReportLab style sheet used by the character sheet.
+    Returns:
+        StyleSheet1: The sample style sheet plus the SectionHeader and CharacterText styles
     """
-    # Import ReportLab classes for PDF generation (imported here for hot-reload compatibility)
-    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-
-    # Set up ReportLab styles for section headers and character text
     styles = getSampleStyleSheet()
     styles.add(ParagraphStyle(name='SectionHeader', fontSize=15, leading=18, spaceAfter=10, fontName='Helvetica-Bold', textColor=colors.saddlebrown))  # For section headers
-    styles.add(ParagraphStyle(name='CharacterText', fontSize=12, leading=15, fontName='Helvetica', textColor=colors.HexColor('#2c1810')))  # For main text
+    styles.add(ParagraphStyle(name='CharacterText', fontSize=12, leading=15, fontName='Helvetica', textColor=_INK))  # For main text
+    return styles
+
+# Built once at import (the import lock makes this thread-safe); styles are read-only during a build
+_STYLES = _build_styles()
+
+# ——— Table Styles ———
+# Every TableStyle is built once at import; tables only reference them per request.
+
+# Ability score grid: one single-column Table holding six stacked boxes.
+# Each box is a name, score and modifier row; a blank spacer row separates boxes.
+_ABILITY_ORDER = ('strength', 'dexterity', 'constitution', 'intelligence', 'wisdom', 'charisma')  # Stats keys
+_ABILITY_NAMES = ('STRENGTH', 'DEXTERITY', 'CONSTITUTION', 'INTELLIGENCE', 'WISDOM', 'CHARISMA')   # Box labels
+_ABILITY_ROWS_PER_BOX = 4  # name, score, modifier, spacer
+_ABILITY_ROW_HEIGHTS = [0.4*inch, 0.5*inch, 0.32*inch, 0.13*inch] * 6
+del _ABILITY_ROW_HEIGHTS[-1]  # No spacer after the last box
+
+def _ability_grid_commands():
+    """Return the TableStyle commands for all six ability boxes in the grid."""
+    commands = []
+    for top in range(0, 6 * _ABILITY_ROWS_PER_BOX, _ABILITY_ROWS_PER_BOX):
+        name, score, mod = (0, top), (0, top + 1), (0, top + 2)
+        commands += [
+            # --- Row 1: Ability Name ---
+            ('BACKGROUND', name, name, colors.red),
+            ('TEXTCOLOR', name, name, colors.black),
+            ('FONTNAME', name, name, 'Helvetica-Bold'),
+            ('FONTSIZE', name, name, 12),
+            # --- Row 2: Score ---
+            ('BACKGROUND', score, score, colors.tan),
+            ('TEXTCOLOR', score, score, _INK),
+            ('FONTNAME', score, score, 'Helvetica-Bold'),
+            ('FONTSIZE', score, score, 26),
+            ('BOTTOMPADDING', score, score, 26),  # Padding for Score Row
+            # --- Row 3: Modifier ---
+            ('BACKGROUND', mod, mod, _PARCHMENT),
+            ('TEXTCOLOR', mod, mod, _INK),
+            ('FONTNAME', mod, mod, 'Helvetica-Bold'),
+            ('FONTSIZE', mod, mod, 13),
+            ('BOTTOMPADDING', mod, mod, 8),  # Padding for Modifier Row
+            # --- Box and Grid ---
+            ('BOX', name, mod, 1, colors.saddlebrown),
+            ('INNERGRID', name, mod, 0.5, colors.saddlebrown),
+        ]
+    return commands
+
+_ABILITY_GRID_STYLE = TableStyle([
+    ('ALIGN', (0,0), (-1,-1), 'CENTER'),
+    ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+] + _ability_grid_commands())
+
+# Race & Class Info table in the page-one header
+_RACE_INFO_STYLE = TableStyle([
+    ('ALIGN', (0,0), (-1,-1), 'CENTER'),
+    ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+    ('BACKGROUND', (0,0), (-1,-1), colors.tan),
+    ('TEXTCOLOR', (0,0), (-1,-1), colors.red),
+    ('FONTNAME', (0,0), (0,-1), 'Helvetica-Bold'),
+    ('FONTNAME', (1,0), (1,-1), 'Helvetica'),
+
+    ('FONTSIZE', (0,0), (-1,-1), 15),
+    ('GRID', (0,0), (-1,-1), 1, colors.saddlebrown),
+    ('ROWBACKGROUNDS', (0,0), (-1,-1), [colors.tan, _PARCHMENT]),
+    ('LEFTPADDING', (0,0), (-1,-1), 0),
+    ('RIGHTPADDING', (0,0), (-1,-1), 8),
+    ('TOPPADDING', (0,0), (-1,-1), 6),
+    ('BOTTOMPADDING', (0,0), (-1,-1), 6),
+])
+
+# Skills table: gold header row, alternating parchment rows
+_SKILLS_STYLE = TableStyle([
+    ('BACKGROUND', (0,0), (-1,0), _GOLD),
+    ('TEXTCOLOR', (0,0), (-1,0), _INK),
+    ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0,0), (-1,0), 13),
+    ('ALIGN', (0,0), (-1,0), 'CENTER'),
+    ('VALIGN', (0,0), (-1,0), 'MIDDLE'),
+    ('BACKGROUND', (0,1), (-1,-1), colors.tan),
+    ('TEXTCOLOR', (0,1), (-1,-1), _INK),
+    ('FONTNAME', (0,1), (-1,-1), 'Helvetica'),
+    ('FONTSIZE', (0,1), (-1,-1), 12),
+    ('ALIGN', (0,1), (-1,-1), 'LEFT'),
+    ('VALIGN', (0,1), (-1,-1), 'MIDDLE'),
+    ('GRID', (0,0), (-1,-1), 1, _LEATHER),
+    ('ROWBACKGROUNDS', (0,1), (-1,-1), [colors.tan, _PARCHMENT]),
+])
+
+# Weapons table
+_WEAPONS_STYLE = TableStyle([
+    ('BACKGROUND', (0,0), (-1,0), _GOLD),
+    ('TEXTCOLOR', (0,0), (-1,0), _INK),
+    ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0,0), (-1,0), 11),
+    ('ALIGN', (0,0), (-1,-1), 'LEFT'),
+    ('BACKGROUND', (0,1), (-1,-1), _CREAM),
+    ('TEXTCOLOR', (0,1), (-1,-1), _INK),
+    ('FONTNAME', (0,1), ( -1,-1), 'Helvetica'),
+    ('FONTSIZE', (0,1), (-1,-1), 9),
+    ('GRID', (0,0), (-1,-1), 1, _LEATHER),
+    ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+    ('ROWBACKGROUNDS', (0,1), (-1,-1), [_CREAM, _PARCHMENT]),
+])
+
+# One spell stat box: label, value, abbreviation (shared by all three boxes)
+_SPELL_STAT_STYLE = TableStyle([
+    # Header
+    ('BACKGROUND', (0,0), (0,0), _INDIGO),
+    ('TEXTCOLOR', (0,0), (0,0), _LAVENDER),
+    ('FONTNAME', (0,0), (0,0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0,0), (0,0), 8),
+    ('ALIGN', (0,0), (0,0), 'CENTER'),
+    ('VALIGN', (0,0), (0,0), 'MIDDLE'),
+
+    # Value
+    ('BACKGROUND', (0,1), (0,1), _LAVENDER),
+    ('TEXTCOLOR', (0,1), (0,1), _INDIGO),
+    ('FONTNAME', (0,1), (0,1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0,1), (0,1), 14),
+    ('ALIGN', (0,1), (0,1), 'CENTER'),
+    ('VALIGN', (0,1), (0,1), 'MIDDLE'),
+
+    # Abbrev
+    ('BACKGROUND', (0,2), (0,2), _GOLD),
+    ('TEXTCOLOR', (0,2), (0,2), _INDIGO),
+    ('FONTNAME', (0,2), (0,2), 'Helvetica-Bold'),
+    ('FONTSIZE', (0,2), (0,2), 8),
+    ('ALIGN', (0,2), (0,2), 'CENTER'),
+    ('VALIGN', (0,2), (0,2), 'MIDDLE'),
+
+    # Borders
+    ('BOX', (0,0), (0,2), 2, _INDIGO),
+    ('INNERGRID', (0,0), (0,2), 1, _INDIGO),
+])
+
+# Row holding the spell stat boxes
+_SPELL_STATS_ROW_STYLE = TableStyle([
+    ('ALIGN', (0,0), (-1,-1), 'CENTER'),
+    ('VALIGN', (0,0), (-1,-1), 'TOP'),
+])
+
+# Box holding the cantrip and 1st-level spell names
+_PURPLE_CONTENT_STYLE = TableStyle([
+    ('BACKGROUND', (0,0), (0,0), _PALE_BLUE),
+    ('TEXTCOLOR', (0,0), (0,0), _INDIGO),
+    ('FONTNAME', (0,0), (0,0), 'Helvetica'),
+    ('FONTSIZE', (0,0), (0,0), 10),
+    ('ALIGN', (0,0), (0,0), 'LEFT'),
+    ('VALIGN', (0,0), (0,0), 'TOP'),
+    ('BOX', (0,0), (0,0), 1, _INDIGO),
+    ('LEFTPADDING', (0,0), (0,0), 8),
+    ('RIGHTPADDING', (0,0), (0,0), 8),
+    ('TOPPADDING', (0,0), (0,0), 6),
+    ('BOTTOMPADDING', (0,0), (0,0), 6),
+])
+
+# ——— Flowables ———
+class _ColoredLabel(Flowable):
+    """
+    Centered text in a filled rectangle, drawn straight onto the canvas.
+    Used for the single-cell decorations (titles, banners, the funds box) that do not need Table layout.
+    Args:
+        text (str): Label text; '\n' starts a new line
+        width, height (float): Size in points
+        bg: Fill color, or None for no fill
+        fg: Text color
+        font (str), size (float): Font name and size
+        border: Border color, or None for no border
+        border_width (float): Border line width
+    """
+    def __init__(self, text, width, height, bg, fg, font, size, border=None, border_width=1):
+        super().__init__()
+        self.text = text
+        self.w, self.h = width, height
+        self.bg, self.fg = bg, fg
+        self.font, self.size = font, size
+        self.border, self.border_width = border, border_width
+        self.hAlign = 'CENTER'  # Center in the frame, like a Table
+    def wrap(self, availWidth, availHeight):
+        return (self.w, self.h)
+    def draw(self):
+        canv = self.canv
+        if self.bg is not None:
+            canv.setFillColor(self.bg)
+            canv.rect(0, 0, self.w, self.h, fill=1, stroke=0)
+        if self.border is not None:
+            canv.setStrokeColor(self.border)
+            canv.setLineWidth(self.border_width)
+            canv.rect(0, 0, self.w, self.h, fill=0, stroke=1)
+        canv.setFillColor(self.fg)
+        canv.setFont(self.font, self.size)
+        lines = self.text.split('\n')
+        leading = self.size * 1.2
+        # Baseline of the first line, so the block of lines is vertically centered
+        y = (self.h + leading * (len(lines) - 1)) / 2 - self.size * 0.35
+        for line in lines:
+            canv.drawCentredString(self.w / 2, y, line)
+            y -= leading
+
+def _spell_banner(text):
+    """Purple banner above the cantrip and 1st-level spell lists."""
+    return _ColoredLabel(text, 5.78*inch, 18, _INDIGO, _LAVENDER,
+                         'Helvetica-Bold', 12, border=_INDIGO, border_width=2)
+
+def _footer_rule():
+    """Full-width saddle-brown rule framing the footer (one line draw instead of 80 shaped glyphs)."""
+    return HRFlowable(width='100%', thickness=1, color=_LEATHER, spaceBefore=4, spaceAfter=4)
+
+# ——— Page Templates ———
+# Page one is split into frames: the title across the top, the ability grid down the left edge,
+# Race & Class Info and Class Features side by side, and the body (skills, weapons, ...) below them.
+# Later pages use one full-width body frame. Each frame is laid out on its own, so nothing is nested.
+_MARGIN = 0.5*inch
+_CONTENT_WIDTH = letter[0] - 2*_MARGIN
+_CONTENT_HEIGHT = letter[1] - 2*_MARGIN
+_TITLE_HEIGHT = 0.6*inch      # Character name
+_ABILITY_WIDTH = 1.7*inch     # Ability Scores column
+_INFO_WIDTH = 3.6*inch        # Race & Class Info
+_HEADER_HEIGHT = 3.4*inch     # Race & Class Info / Class Features row
+
+def _page_templates():
+    """
+    Build the page templates for one document.
+    Frames track their fill position while a document builds, so each build gets its own.
+    Returns:
+        list: The 'first' (page one) and 'body' PageTemplates
+    """
+    top = _MARGIN + _CONTENT_HEIGHT - _TITLE_HEIGHT  # Bottom edge of the title frame
+    right_x = _MARGIN + _ABILITY_WIDTH               # Left edge of everything right of the abilities
+    first_page = [
+        Frame(_MARGIN, top, _CONTENT_WIDTH, _TITLE_HEIGHT, id='title'),
+        Frame(_MARGIN, _MARGIN, _ABILITY_WIDTH, top - _MARGIN, id='abilities'),
+        Frame(right_x, top - _HEADER_HEIGHT, _INFO_WIDTH, _HEADER_HEIGHT, id='info'),
+        Frame(right_x + _INFO_WIDTH, top - _HEADER_HEIGHT,
+              _CONTENT_WIDTH - _ABILITY_WIDTH - _INFO_WIDTH, _HEADER_HEIGHT, id='features'),
+        Frame(right_x, _MARGIN, _CONTENT_WIDTH - _ABILITY_WIDTH, top - _HEADER_HEIGHT - _MARGIN, id='body'),
+    ]
+    return [
+        PageTemplate(id='first', frames=first_page),
+        PageTemplate(id='body', frames=[Frame(_MARGIN, _MARGIN, _CONTENT_WIDTH, _CONTENT_HEIGHT, id='body')]),
+    ]
+
+# ——— Row Helpers ———
+_CENTERED = "<para align='center'>%s</para>"  # Centered paragraph markup
+
+# Gear sections on the sheet: (equipment key, title, center the title)
+_GEAR_SECTIONS = (
+    ('adventuring_gear', 'ADVENTURING GEAR', True),
+    ('special_equipment', 'SPECIAL EQUIPMENT', True),
+    ('unequipped_items', 'UNEQUIPPED ITEMS', False),
+)
+
+# Walking speed by race; races not listed move 30 ft
+_RACE_SPEEDS = {
+    'Dwarf': '25 ft', 'Hill Dwarf': '25 ft', 'Mountain Dwarf': '25 ft',
+    'Halfling': '25 ft', 'Lightfoot Halfling': '25 ft', 'Stout Halfling': '25 ft',
+}
+
+_NAME_KEYS = ('character_name', 'name', 'char_name')  # Older sessions stored the name under other keys
+
+@lru_cache(maxsize=32)
+def _features_for(char_class):
+    """
+    Return the class features listed on the sheet for a class (empty for unknown classes).
+    CLASS_FEATURES is imported on first use so rendering (e.g. in a pool process) does not
+    pull in the characters blueprint and its forms up front.
+    """
+    from .characters import CLASS_FEATURES
+    return tuple(CLASS_FEATURES.get(char_class, ()))
+
+def _first_value(data, keys, default):
+    """Return the first truthy value among the given keys, or the default."""
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return default
+
+_CHECK = "✔"  # Skills table: proficient
+_EMPTY = ""   # Skills table: not proficient
+
+def _build_info_data(data, char_class, armor_class, hit_points):
+    """
+    Build the Race & Class Info rows.
+    Args:
+        data (Mapping): Character data
+        char_class (str): The character's class
+        armor_class (int): Calculated AC
+        hit_points (int): Maximum HP
+    Returns:
+        list: [label, value] rows
+    """
+    return [
+        # Each row is a (label, value) pair for the character's summary info
+        ['Race', data.get('race', 'Unknown')],
+        ['Class', char_class],
+        ['Level', '1'],
+        ['Primary Ability', data.get('primary_ability', 'Unknown')],
+        ['AC', str(armor_class)],
+        ['HP', str(hit_points)],
+        ['Speed', _RACE_SPEEDS.get(data.get('race') or '', '30 ft')],
+    ]
+
+def _pair_label(entry):
+    # (key, label, ...) -> label
+    return entry[1] if len(entry) >= 2 else str(entry)
+
+# Stored spell entry type -> display name extractor; any other type falls back to str()
+_SPELL_NAME_EXTRACTORS = {
+    list: _pair_label,
+    tuple: _pair_label,
+    str: str,
+}
+
+def _spell_entry_name(spell):
+    """Return the display name of a stored spell: a (key, label, ...) tuple, a plain string, or anything else."""
+    return _SPELL_NAME_EXTRACTORS.get(type(spell), str)(spell)
+
+def _spell_list_box(spells):
+    """Box listing the spells' names in one pass, joined with diamonds."""
+    text = " ◆ ".join(_spell_entry_name(spell) for spell in spells)
+    return Table([[text]], colWidths=[5.78*inch], style=_PURPLE_CONTENT_STYLE)
+
+def _normalize_gear(equipment):
+    """
+    Return each gear section of the equipment as a list.
+    special_equipment is stored as a dict (slot -> item); its items are taken in order.
+    Args:
+        equipment (dict): The character's equipment
+    Returns:
+        dict: Gear section key -> list of items (empty if missing)
+    """
+    special = equipment.get('special_equipment') or []
+    return {
+        'adventuring_gear': list(equipment.get('adventuring_gear') or []),
+        'special_equipment': list(special.values() if isinstance(special, dict) else special),
+        'unequipped_items': list(equipment.get('unequipped_items') or []),
+    }
+
+def _gear_item_text(item, gear_key):
+    """
+    Format one gear entry for the gear sections.
+    Args:
+        item: A gear dict (name, quantity, ...) or any other value
+        gear_key (str): The equipment section the item belongs to
+    Returns:
+        str: e.g. 'Torch (x10)' or 'Chain Mail (Not proficient)'
+    """
+    if not isinstance(item, dict):
+        return str(item)
+    if gear_key == 'unequipped_items':
+        return f"{item.get('name', 'Unknown')} ({item.get('reason', 'No reason given')})"
+    item_name = item.get('name', str(item))
+    if item_name.lower() in ('ammunition', 'musical instrument'):
+        # Show the specific type instead of the generic category name
+        specific_type = item.get('type') or item.get('subtype') or item.get('item_type')
+        if specific_type:
+            item_name = specific_type.capitalize()
+    qty = item.get('quantity') or item.get('count')
+    return f"{item_name} (x{qty})" if qty else item_name
+
+# ——— Rendering ———
+_BUFFER_LOCAL = threading.local()  # One reusable output buffer per worker thread
 
-    # Create a buffer and PDF document
-    buffer = io.BytesIO()  # In-memory buffer for PDF
-    doc = SimpleDocTemplate(
+def _get_buffer():
+    """Return this thread's PDF output buffer, emptied and rewound for the next render."""
+    buffer = getattr(_BUFFER_LOCAL, 'buffer', None)
+    if buffer is None:
+        buffer = _BUFFER_LOCAL.buffer = io.BytesIO()
+    else:
+        buffer.seek(0)
+        buffer.truncate()
+    return buffer
+
+def _render_pdf(data):
+    """
+    Render the character sheet PDF.
+    Layout depends on the character (table row counts, spell pages, gear lists), so the whole
+    sheet is laid out per character; this function only needs the character data, not a request.
+    Args:
+        data (Mapping): Character data, as stored in the session
+    Returns:
+        bytes: The finished PDF document
+    """
+    # ReportLab styles for section headers and character text (shared, built at import)
+    styles = _STYLES
+
+    # Reuse this thread's buffer and create the PDF document
+    buffer = _get_buffer()  # In-memory buffer for PDF
+    doc = BaseDocTemplate(
         buffer,
         pagesize=letter,
-        leftMargin=0.5*inch, rightMargin=0.5*inch,
-        topMargin=0.5*inch, bottomMargin=0.5*inch
+        leftMargin=_MARGIN, rightMargin=_MARGIN,
+        topMargin=_MARGIN, bottomMargin=_MARGIN,
+        pageTemplates=_page_templates()
     )
     story = []  # List of flowables (content blocks) for the PDF
 
     # Character name (try multiple keys for compatibility)
-    char_name = session.get('character_name') or session.get('name') or session.get('char_name') or 'Unnamed Hero'
+    char_name = _first_value(data, _NAME_KEYS, 'Unnamed Hero')
     # Add character name as a centered, bold title
     story.append(Paragraph(f"<para align='center'><b>{char_name}</b></para>", styles['Title']))
-    story.append(Spacer(1, 8))  # Small vertical space
+    story.append(FrameBreak())  # End of the title frame
 
     # Gather stats and equipment from session
-    stats = session.get("adjusted_stats", {}) or {}  # Final stats dict
-    dex_mod = (stats.get('dexterity', 10) - 10) // 2  # Dexterity modifier
-    con_mod = (stats.get('constitution', 10) - 10) // 2  # Constitution modifier
-    equipment = session.get('equipment', {}) or {}  # Equipment dict
+    stats = data.get("adjusted_stats", {}) or {}  # Final stats dict
+    char_class = data.get('class', 'Unknown')  # Read once; used by the info table, features and spells
+    # Every score (default 10 if missing) and modifier, computed once for the AC and the ability grid
+    scores = [stats.get(ability, 10) for ability in _ABILITY_ORDER]
+    mods = calculate_ability_modifiers(scores)
+    dex_mod = mods[1]  # Dexterity modifier
+    equipment = data.get('equipment', {}) or {}  # Equipment dict
 
     # Calculate Armor Class (AC)
     armor_class = equipment.get('armor_class')  # Use explicit AC if present
@@ -67,238 +477,65 @@ def download_pdf():
             armor_class = base_ac
 
     # Get Hit Points (HP)
-    hit_points = session.get('max_hp')
-    # Build info table (race, class, etc.)
-    info_data = [
-        # Each row is a (label, value) pair for the character's summary info
-        ['Race', session.get('race', 'Unknown')],
-        ['Class', session.get('class', 'Unknown')],
-        ['Level', '1'],
-        ['Primary Ability', session.get('primary_ability', 'Unknown')],
-        ['AC', str(armor_class)],
-        ['HP', str(hit_points)],
-        ['Speed', "25 ft" if ('dwarf' in (session.get('race') or '').lower() or 'halfling' in (session.get('race') or '').lower()) else "30 ft"]
-    ]
-    # Table for displaying character info (race, class, AC, etc.)
-    info_table = Table(info_data, colWidths=[1.2*inch, 1.2*inch])
-    info_table.setStyle(TableStyle([
-        ('BACKGROUND', (0,0), (-1,-1), colors.red),  # Red background for all cells
-        ('TEXTCOLOR', (0,0), (-1,-1), colors.red),    # Red text (overridden below)
-        ('ALIGN', (0,0), (-1,-1), 'LEFT'),
-        ('FONTNAME', (0,0), (0,-1), 'Helvetica-Bold'),  # Bold for labels
-        ('FONTNAME', (1,0), (1,-1), 'Helvetica'),       # Regular for values
-        ('FONTSIZE', (0,0), (-1,-1), 12),  # All rows use font size 12
-        ('GRID', (0,0), (-1,-1), 1, colors.red),
-        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-        ('ROWBACKGROUNDS', (0,0), (-1,-1), [colors.red, colors.red]),
-        ('LEFTPADDING', (0,0), (-1,-1), 0),
-        ('RIGHTPADDING', (0,0), (-1,-1), 8),
-        ('TOPPADDING', (0,0), (-1,-1), 6),
-        ('BOTTOMPADDING', (0,0), (-1,-1), 6),
-    ]))
-    # ...existing code...
-
-    # === ABILITY SCORES: Build ability score boxes for the PDF ===
-    # Create a vertical stack of boxes for each ability (Strength, Dexterity, etc.)
-    # Each box shows the ability name, score, and modifier, styled with colors and fonts
-    # AbilityColumn is a custom Flowable to stack the boxes vertically
-    # 3. Build the ability score display boxes for the PDF
-    #    - ability_order: keys for stats dict
-    #    - ability_names: display names for each ability
-    ability_order = ['strength', 'dexterity', 'constitution', 'intelligence', 'wisdom', 'charisma']
-    ability_names = ['STRENGTH', 'DEXTERITY', 'CONSTITUTION', 'INTELLIGENCE', 'WISDOM', 'CHARISMA']
-    ability_boxes = []
-    for i, ability in enumerate(ability_order):
-        ability_name = ability_names[i]
-        # Get the score for this ability (default 10 if missing)
-        score = stats.get(ability, 10)
-        # Calculate the modifier for this ability
-        mod = (score - 10) // 2
-        # Prepare the data for the 3-row box: name, score, modifier
-        box_data = [
-            [ability_name],
-            [f"{score}"],
-            [f"{'+' if mod >= 0 else ''}{mod}"]
-        ]
-        # Create the table for this ability's box
-        ability_box = Table(box_data, colWidths=[1.32*inch], rowHeights=[0.4*inch, 0.5*inch, 0.32*inch])
-        # Style the table: see comments for each row
-        ability_box.setStyle(TableStyle([
-            # --- Row 1: Ability Name ---
-            ('BACKGROUND', (0,0), (0,0), colors.red),
-            ('TEXTCOLOR', (0,0), (0,0), colors.black),
-            ('FONTNAME', (0,0), (0,0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0,0), (0,0), 12),
-            ('ALIGN', (0,0), (0,0), 'CENTER'),
-            ('VALIGN', (0,0), (0,0), 'MIDDLE'),
-            # --- Row 2: Score ---
-            ('BACKGROUND', (0,1), (0,1), colors.tan),
-            ('TEXTCOLOR', (0,1), (0,1), colors.HexColor('#2c1810')),
-            ('FONTNAME', (0,1), (0,1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0,1), (0,1), 26),
-            ('ALIGN', (0,1), (0,1), 'CENTER'),
-            ('VALIGN', (0,1), (0,1), 'MIDDLE'),
-            ('BOTTOMPADDING', (0,1), (0,1), 26),  # Padding for Score Row 
-            # Row 3: Modifier 
-            ('BACKGROUND', (0,2), (0,2), colors.HexColor('#e8dcc0')),
-            ('TEXTCOLOR', (0,2), (0,2), colors.HexColor('#2c1810')),
-            ('FONTNAME', (0,2), (0,2), 'Helvetica-Bold'),
-            ('FONTSIZE', (0,2), (0,2), 13),
-            ('ALIGN', (0,2), (0,2), 'CENTER'),
-            ('VALIGN', (0,2), (0,2), 'MIDDLE'),
-            # --- Box and Grid ---
-            ('BOX', (0,0), (0,2), 1, colors.saddlebrown),
-            ('INNERGRID', (0,0), (0,2), 0.5, colors.saddlebrown),            
-            ('BOTTOMPADDING', (0,2), (0,2), 8),     # Padding for Modifier Row
-        ]))
-        ability_boxes.append(ability_box)
-    from reportlab.platypus import Flowable
-    class AbilityColumn(Flowable):
-        def __init__(self, boxes):
-            super().__init__()
-            self.boxes = boxes
-        def wrap(self, availWidth, availHeight):
-            # Make the column a bit wider for left alignment
-            return (1.47*inch, 2.2*inch)
-        def draw(self):
-            # Vertical positioning of the ability score boxes 
-            # y controls how far down the boxes start relative to the title above.
-            # Lower y moves the boxes further down; raise y to move them closer to the title.
-            y = 1.25*inch  # Adjust this value to control vertical spacing below the title
-            x = 0.38*inch  # shift right more
-            box_height = 0.4 + 0.5 + 0.32  # sum of rowHeights in inches
-            spacing = 0.13*inch  # extra space between boxes
-            for box in self.boxes:
-                box.wrapOn(self.canv, 1.32*inch, box_height*inch)
-                box.drawOn(self.canv, x, y)
-                y -= (box_height*inch + spacing)
-    ability_column = AbilityColumn(ability_boxes)
-
-    # Import class features for the character's class
-    from .characters import CLASS_FEATURES
-    char_class = session.get('class', 'Unknown')
-    features = CLASS_FEATURES.get(char_class, [])
+    hit_points = data.get('max_hp')
+    # Rows for the Race & Class Info table (race, class, AC, etc.)
+    info_data = _build_info_data(data, char_class, armor_class, hit_points)
+
+    # === ABILITY SCORES: Build the ability score grid for the PDF ===
+    # One Table stacks a box per ability (Strength, Dexterity, etc.), laid out natively by ReportLab
+    # Each box shows the ability name, score, and modifier; _ABILITY_GRID_STYLE colors the rows
+    ability_data = []
+    for ability_name, score, mod in zip(_ABILITY_NAMES, scores, mods):
+        # Name, score, modifier, then a blank spacer row before the next box
+        ability_data += [[ability_name], [str(score)], [f"+{mod}" if mod >= 0 else str(mod)], [""]]
+    ability_data.pop()  # No spacer after the last box
+    ability_column = Table(ability_data, colWidths=[1.32*inch], rowHeights=_ABILITY_ROW_HEIGHTS, style=_ABILITY_GRID_STYLE)
+
+    # Class features for the character's class
+    features = _features_for(char_class)
+
+    # Fill the page-one frames in order: Ability Scores, Race & Class Info, Class Features
+    # Ability Scores title, each word on its own line, centered over the grid
+    story.append(_ColoredLabel("Ability\nScores", 1.32*inch, 0.6*inch, None, colors.red, 'Helvetica-Bold', 15))
+    story.append(Spacer(1, 16))  # Vertical space below title
+    story.append(ability_column)
+    story.append(FrameBreak())
+
+    story.append(Paragraph("<para align='center'><b>Race & Class Info</b></para>", styles['SectionHeader']))
+    story.append(Table(info_data, colWidths=[1.6*inch, 1.6*inch], style=_RACE_INFO_STYLE))
+    story.append(FrameBreak())
 
-    # Build the three-column layout: Ability Scores (left), Race & Class Info (center), Class Features (right)
-    # Each column is a list of flowables (tables, paragraphs, etc.)
-    class_features_flow = []
     if features:
-        class_features_flow.append(Paragraph("<b>Class Features</b>", styles['SectionHeader']))
+        story.append(Paragraph("<b>Class Features</b>", styles['SectionHeader']))
         for feature in features:
-            class_features_flow.append(Paragraph(f"• {feature}", styles['CharacterText']))
-    # Move ability boxes directly under title, shift left, and move Class Features to right edge
-    # Move the Ability Scores title to the right to center above the boxes (without moving the boxes)
-    # 4. Display the Ability Scores title and the column of boxes in the PDF
-    # Ability Scores Title as a Table for precise control 
-    ability_title_table = Table(
-        [["Ability\nScores"]],  # Each word on its own line
-        colWidths=[1.32*inch],
-        rowHeights=[0.6*inch]
-    )
-    ability_title_table.setStyle(TableStyle([
-    ('TEXTCOLOR', (0,0), (0,0), colors.red),
-        ('FONTNAME', (0,0), (0,0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0,0), (0,0), 15),
-        ('ALIGN', (0,0), (0,0), 'CENTER'),
-        ('VALIGN', (0,0), (0,0), 'MIDDLE'),
-        # Adjust these paddings for fine-tuned positioning 
-        ('LEFTPADDING', (0,0), (0,0), 70),   # Increase to move text right
-        ('RIGHTPADDING', (0,0), (0,0), 12),  # Increase to move text left
-        ('TOPPADDING', (0,0), (0,0), 6),     # Increase to move text down
-        ('BOTTOMPADDING', (0,0), (0,0), 6),  # Increase to move text up
-    # ('BOX', (0,0), (0,0), 1, colors.white),
-    ]))
-    ability_scores_col = [
-        ability_title_table,  # Table title for precise control
-        Spacer(1, 16),        # Adjust vertical space below title
-        ability_column
-    ]
-    from reportlab.platypus import Spacer
-    race_info_col = [Spacer(1, 0), Paragraph("<para align='center'><b>Race & Class Info</b></para>", styles['SectionHeader']), Table(info_data, colWidths=[1.6*inch, 1.6*inch], style=TableStyle([
-        ('ALIGN', (0,0), (-1,-1), 'CENTER'),
-        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-    ('BACKGROUND', (0,0), (-1,-1), colors.tan),
-    ('TEXTCOLOR', (0,0), (-1,-1), colors.red),
-        ('FONTNAME', (0,0), (0,-1), 'Helvetica-Bold'),
-        ('FONTNAME', (1,0), (1,-1), 'Helvetica'),
+            story.append(Paragraph(f"• {feature}", styles['CharacterText']))
+    story.append(FrameBreak())
 
-        ('FONTSIZE', (0,0), (-1,-1), 15),
-    ('GRID', (0,0), (-1,-1), 1, colors.saddlebrown),
-    ('ROWBACKGROUNDS', (0,0), (-1,-1), [colors.tan, colors.HexColor('#e8dcc0')]),
-        ('LEFTPADDING', (0,0), (-1,-1), 0),
-        ('RIGHTPADDING', (0,0), (-1,-1), 8),
-        ('TOPPADDING', (0,0), (-1,-1), 6),
-        ('BOTTOMPADDING', (0,0), (-1,-1), 6),
-    ]))]
-    # Increase right column width to push Class Features further right
-    # Add a spacer column to push Class Features to the right edge
-    spacer_col = ""
-    # Add a left Spacer to race_info_col to shift it right to align with skills_table (2.2*inch)
-    race_info_col_with_spacer = [Spacer(2.2*inch, 0)] + race_info_col[1:]
-    three_col_table = Table([
-        [ability_scores_col, race_info_col_with_spacer, spacer_col, class_features_flow]
-    ], colWidths=[1.45*inch, 4.0*inch, 0.7*inch, 2.55*inch])
-    three_col_table.setStyle(TableStyle([
-        ('VALIGN', (0,0), (-1,-1), 'TOP'),
-        ('ALIGN', (0,0), (0,0), 'LEFT'),
-        ('ALIGN', (1,0), (1,0), 'CENTER'),
-        ('ALIGN', (2,0), (2,0), 'CENTER'),  # spacer
-        ('ALIGN', (3,0), (3,0), 'RIGHT'),
-        ('LEFTPADDING', (0,0), (0,0), 0),
-        ('RIGHTPADDING', (0,0), (0,0), 6),
-        ('LEFTPADDING', (1,0), (1,0), 2.2*inch),  # Shift Race & Class Info right to align with skills table
-        ('RIGHTPADDING', (1,0), (1,0), 0),
-        ('LEFTPADDING', (2,0), (2,0), 0),
-        ('RIGHTPADDING', (2,0), (2,0), 0),
-    ('LEFTPADDING', (3,0), (3,0), 0.5*inch),  # Move Class Features right
-        ('RIGHTPADDING', (3,0), (3,0), 0),
-        ('TOPPADDING', (0,0), (-1,-1), 2),
-        ('BOTTOMPADDING', (0,0), (-1,-1), 2),
-    ]))
-    story.append(three_col_table)
-    story.append(Spacer(1, 12))
-
-    # Class Features section (below two-column layout) -- already included above, so skip here
+    # Everything below flows through the body frame; pages after the first use the full width
+    story.append(NextPageTemplate('body'))
 
     # === SKILLS SECTION ===
     # If the character has skills, display them in a styled table
     # Each row shows the skill name, ability, modifier, and proficiency
     # Skills table
-    skills_list = session.get('skills_list', []) or []
+    skills_list = data.get('skills_list', []) or []
     if skills_list:
         story.append(Paragraph("<para align='center'><b>Skills</b></para>", styles['SectionHeader']))
         table_data = [["Skill", "Ability", "Mod", "Proficient"]]
-        for skill in skills_list:
-            table_data.append([
-                skill.get("name", ""),
-                skill.get("ability", ""),
-                str(skill.get("mod", "")),
-                "✔" if skill.get("proficient") else ""
-            ])
+        table_data.extend(
+            [skill.get("name", ""), skill.get("ability", ""), str(skill.get("mod", "")),
+             _CHECK if skill.get("proficient") else _EMPTY]
+            for skill in skills_list
+        )
         skills_table = Table(table_data, colWidths=[2.2*inch, 1*inch, 0.7*inch, 0.8*inch])
-        skills_table.setStyle(TableStyle([
-            ('BACKGROUND', (0,0), (-1,0), colors.HexColor('#d4af37')),
-            ('TEXTCOLOR', (0,0), (-1,0), colors.HexColor('#2c1810')),
-            ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0,0), (-1,0), 13),
-            ('ALIGN', (0,0), (-1,0), 'CENTER'),
-            ('VALIGN', (0,0), (-1,0), 'MIDDLE'),
-            ('BACKGROUND', (0,1), (-1,-1), colors.tan),
-            ('TEXTCOLOR', (0,1), (-1,-1), colors.HexColor('#2c1810')),
-            ('FONTNAME', (0,1), (-1,-1), 'Helvetica'),
-            ('FONTSIZE', (0,1), (-1,-1), 12),
-            ('ALIGN', (0,1), (-1,-1), 'LEFT'),
-            ('VALIGN', (0,1), (-1,-1), 'MIDDLE'),
-            ('GRID', (0,0), (-1,-1), 1, colors.HexColor('#8b4513')),
-            ('ROWBACKGROUNDS', (0,1), (-1,-1), [colors.tan, colors.HexColor('#e8dcc0')]),
-        ]))
+        skills_table.setStyle(_SKILLS_STYLE)
         story.append(Spacer(1, 12))
         story.append(skills_table)
         story.append(Spacer(1, 8))
         prof_bonus = 2
         # Center Proficiency Bonus and Passive Perception
         story.append(Paragraph(f"<para align='center'>Proficiency Bonus: <b>+{prof_bonus}</b></para>", styles['CharacterText']))
-        passive_perception = session.get('passive_perception')
+        passive_perception = data.get('passive_perception')
         if passive_perception:
             story.append(Paragraph(f"<para align='center'>Passive Perception: <b>{passive_perception}</b></para>", styles['CharacterText']))
 
@@ -313,28 +550,14 @@ def download_pdf():
     if weapons := equipment.get('weapons', []):
         story.append(Paragraph("⚔️ WEAPONS & ARMAMENTS ⚔️", styles['SectionHeader']))
         weapon_data = [['Weapon', 'Damage', 'Properties']]
-        for weapon in weapons:
-            properties_text = ', '.join(weapon.get('properties', [])) if weapon.get('properties') else 'None'
-            weapon_data.append([
-                weapon.get('name', 'Unknown'),
-                f"{weapon.get('damage', '')} {weapon.get('damage_type', '')}".strip(),
-                properties_text
-            ])
+        weapon_data.extend(
+            [weapon.get('name', 'Unknown'),
+             f"{weapon.get('damage', '')} {weapon.get('damage_type', '')}".strip(),
+             ', '.join(weapon['properties']) if weapon.get('properties') else 'None']
+            for weapon in weapons
+        )
         weapon_table = Table(weapon_data, colWidths=[2*inch, 1.5*inch, 2*inch])
-        weapon_table.setStyle(TableStyle([
-            ('BACKGROUND', (0,0), (-1,0), colors.HexColor('#d4af37')),
-            ('TEXTCOLOR', (0,0), (-1,0), colors.HexColor('#2c1810')),
-            ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0,0), (-1,0), 11),
-            ('ALIGN', (0,0), (-1,-1), 'LEFT'),
-            ('BACKGROUND', (0,1), (-1,-1), colors.HexColor('#f4f1e8')),
-            ('TEXTCOLOR', (0,1), (-1,-1), colors.HexColor('#2c1810')),
-            ('FONTNAME', (0,1), ( -1,-1), 'Helvetica'),
-            ('FONTSIZE', (0,1), (-1,-1), 9),
-            ('GRID', (0,0), (-1,-1), 1, colors.HexColor('#8b4513')),
-            ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-            ('ROWBACKGROUNDS', (0,1), (-1,-1), [colors.HexColor('#f4f1e8'), colors.HexColor('#e8dcc0')]),
-        ]))
+        weapon_table.setStyle(_WEAPONS_STYLE)
         story.append(weapon_table)
         story.append(Spacer(1, 15))
     
@@ -342,17 +565,16 @@ def download_pdf():
     # If the character is a Wizard or Cleric, display spellcasting stats and spell lists
     # Includes spell save DC, attack bonus, spell ability, cantrips, and level 1 spells
     # SPELLCASTING SECTION (for Wizards and Clerics) 
-    if session.get('class') in ["Wizard", "Cleric"]:
-        from reportlab.platypus import PageBreak
+    if char_class in ["Wizard", "Cleric"]:
         story.append(PageBreak())  # Start spellcasting section on a new page
         # Center Spellcasting Magic title using a centered Paragraph
         story.append(Paragraph("<para align='center'>🔮 SPELLCASTING MAGIC 🔮</para>", styles['SectionHeader']))
         story.append(Spacer(1, 2))
 
         # Spellcasting ability and stats
-        spellcasting_ability = 'Intelligence' if session.get('class') == 'Wizard' else 'Wisdom'
-        spell_save_dc = session.get('spell_save_dc', 'N/A')
-        spell_attack_bonus = session.get('spell_attack_bonus', 0)
+        spellcasting_ability = 'Intelligence' if char_class == 'Wizard' else 'Wisdom'
+        spell_save_dc = data.get('spell_save_dc', 'N/A')
+        spell_attack_bonus = data.get('spell_attack_bonus', 0)
 
         # Create spell stats boxes
         spell_stat_boxes = []
@@ -369,133 +591,27 @@ def download_pdf():
                 [abbrev]
             ]
             spell_box = Table(box_data, colWidths=[1.6*inch], rowHeights=[0.25*inch, 0.5*inch, 0.2*inch])
-            spell_box.setStyle(TableStyle([
-                # Header
-                ('BACKGROUND', (0,0), (0,0), colors.HexColor('#4b0082')),
-                ('TEXTCOLOR', (0,0), (0,0), colors.HexColor('#e6e6fa')),
-                ('FONTNAME', (0,0), (0,0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0,0), (0,0), 8),
-                ('ALIGN', (0,0), (0,0), 'CENTER'),
-                ('VALIGN', (0,0), (0,0), 'MIDDLE'),
-
-                # Value
-                ('BACKGROUND', (0,1), (0,1), colors.HexColor('#e6e6fa')),
-                ('TEXTCOLOR', (0,1), (0,1), colors.HexColor('#4b0082')),
-                ('FONTNAME', (0,1), (0,1), 'Helvetica-Bold'),
-                ('FONTSIZE', (0,1), (0,1), 14),
-                ('ALIGN', (0,1), (0,1), 'CENTER'),
-                ('VALIGN', (0,1), (0,1), 'MIDDLE'),
-
-                # Abbrev
-                ('BACKGROUND', (0,2), (0,2), colors.HexColor('#d4af37')),
-                ('TEXTCOLOR', (0,2), (0,2), colors.HexColor('#4b0082')),
-                ('FONTNAME', (0,2), (0,2), 'Helvetica-Bold'),
-                ('FONTSIZE', (0,2), (0,2), 8),
-                ('ALIGN', (0,2), (0,2), 'CENTER'),
-                ('VALIGN', (0,2), (0,2), 'MIDDLE'),
-
-                # Borders
-                ('BOX', (0,0), (0,2), 2, colors.HexColor('#4b0082')),
-                ('INNERGRID', (0,0), (0,2), 1, colors.HexColor('#4b0082')),
-            ]))
+            spell_box.setStyle(_SPELL_STAT_STYLE)
             spell_stat_boxes.append(spell_box)
 
         # Display spell stat boxes, centered, with correct width for purple box
         spell_stats_row = Table([spell_stat_boxes], colWidths=[1.7*inch] * len(spell_stat_boxes))
-        spell_stats_row.setStyle(TableStyle([
-            ('ALIGN', (0,0), (-1,-1), 'CENTER'),
-            ('VALIGN', (0,0), (-1,-1), 'TOP'),
-        ]))
+        spell_stats_row.setStyle(_SPELL_STATS_ROW_STYLE)
         story.append(spell_stats_row)
         story.append(Spacer(1, 15))
         
         # Cantrips section
-        if cantrips := session.get('cantrips'):
-            cantrip_header_table = Table([['⭐ CANTRIPS (AT WILL) ⭐']], colWidths=[5.78*inch])
-            cantrip_header_table.setStyle(TableStyle([
-                ('BACKGROUND', (0,0), (0,0), colors.HexColor('#4b0082')),
-                ('TEXTCOLOR', (0,0), (0,0), colors.HexColor('#e6e6fa')),
-                ('FONTNAME', (0,0), (0,0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0,0), (0,0), 12),
-                ('ALIGN', (0,0), (0,0), 'CENTER'),
-                ('VALIGN', (0,0), (0,0), 'MIDDLE'),
-                ('BOX', (0,0), (0,0), 2, colors.HexColor('#4b0082')),
-            ]))
-            story.append(cantrip_header_table)
-            
-            # Process cantrips
-            cantrip_names = []
-            for cantrip in cantrips:
-                if isinstance(cantrip, (list, tuple)) and len(cantrip) >= 2:
-                    cantrip_names.append(cantrip[1])
-                elif isinstance(cantrip, str):
-                    cantrip_names.append(cantrip)
-                else:
-                    cantrip_names.append(str(cantrip))
-            
-            # Display cantrips in a box
-            cantrip_text = " ◆ ".join(cantrip_names)
-            cantrip_content_table = Table([[cantrip_text]], colWidths=[5.78*inch])
-            cantrip_content_table.setStyle(TableStyle([
-                ('BACKGROUND', (0,0), (0,0), colors.HexColor('#f0f0ff')),
-                ('TEXTCOLOR', (0,0), (0,0), colors.HexColor('#4b0082')),
-                ('FONTNAME', (0,0), (0,0), 'Helvetica'),
-                ('FONTSIZE', (0,0), (0,0), 10),
-                ('ALIGN', (0,0), (0,0), 'LEFT'),
-                ('VALIGN', (0,0), (0,0), 'TOP'),
-                ('BOX', (0,0), (0,0), 1, colors.HexColor('#4b0082')),
-                ('LEFTPADDING', (0,0), (0,0), 8),
-                ('RIGHTPADDING', (0,0), (0,0), 8),
-                ('TOPPADDING', (0,0), (0,0), 6),
-                ('BOTTOMPADDING', (0,0), (0,0), 6),
-            ]))
-            story.append(cantrip_content_table)
+        if cantrips := data.get('cantrips'):
+            story.append(_spell_banner('⭐ CANTRIPS (AT WILL) ⭐'))
+            story.append(_spell_list_box(cantrips))  # Display cantrips in a box
             story.append(Spacer(1, 10))
         
         # Level 1 Spells section
-        if level1_spells := session.get('level1_spells'):
-            class_name = session.get('class')
-            header_text = "📚 1ST LEVEL SPELLS (SPELLBOOK) 📚" if class_name == "Wizard" else "🙏 1ST LEVEL SPELLS (PREPARED) 🙏"
-            
-            spell_header_table = Table([[header_text]], colWidths=[5.78*inch])
-            spell_header_table.setStyle(TableStyle([
-                ('BACKGROUND', (0,0), (0,0), colors.HexColor('#4b0082')),
-                ('TEXTCOLOR', (0,0), (0,0), colors.HexColor('#e6e6fa')),
-                ('FONTNAME', (0,0), (0,0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0,0), (0,0), 12),
-                ('ALIGN', (0,0), (0,0), 'CENTER'),
-                ('VALIGN', (0,0), (0,0), 'MIDDLE'),
-                ('BOX', (0,0), (0,0), 2, colors.HexColor('#4b0082')),
-            ]))
-            story.append(spell_header_table)
+        if level1_spells := data.get('level1_spells'):
+            header_text = "📚 1ST LEVEL SPELLS (SPELLBOOK) 📚" if char_class == "Wizard" else "🙏 1ST LEVEL SPELLS (PREPARED) 🙏"
             
-            # Process level 1 spells
-            spell_names = []
-            for spell in level1_spells:
-                if isinstance(spell, (list, tuple)) and len(spell) >= 2:
-                    spell_names.append(spell[1])
-                elif isinstance(spell, str):
-                    spell_names.append(spell)
-                else:
-                    spell_names.append(str(spell))
-            
-            # Display spells in a box
-            spell_text = " ◆ ".join(spell_names)
-            spell_content_table = Table([[spell_text]], colWidths=[5.78*inch])
-            spell_content_table.setStyle(TableStyle([
-                ('BACKGROUND', (0,0), (0,0), colors.HexColor('#f0f0ff')),
-                ('TEXTCOLOR', (0,0), (0,0), colors.HexColor('#4b0082')),
-                ('FONTNAME', (0,0), (0,0), 'Helvetica'),
-                ('FONTSIZE', (0,0), (0,0), 10),
-                ('ALIGN', (0,0), (0,0), 'LEFT'),
-                ('VALIGN', (0,0), (0,0), 'TOP'),
-                ('BOX', (0,0), (0,0), 1, colors.HexColor('#4b0082')),
-                ('LEFTPADDING', (0,0), (0,0), 8),
-                ('RIGHTPADDING', (0,0), (0,0), 8),
-                ('TOPPADDING', (0,0), (0,0), 6),
-                ('BOTTOMPADDING', (0,0), (0,0), 6),
-            ]))
-            story.append(spell_content_table)
+            story.append(_spell_banner(header_text))
+            story.append(_spell_list_box(level1_spells))  # Display spells in a box
         
         story.append(Spacer(1, 20))
     
@@ -503,59 +619,25 @@ def download_pdf():
     # Display lists of adventuring gear, special equipment, and unequipped items
     # Each section is styled and can show items as a list or bullet points
     # ADVENTURING GEAR SECTION 
-    gear_sections = [
-        ('adventuring_gear', 'ADVENTURING GEAR'),
-        ('special_equipment', 'SPECIAL EQUIPMENT'),
-        ('unequipped_items', 'UNEQUIPPED ITEMS')
-    ]
-    
-    for gear_key, gear_title in gear_sections:
-        gear_items = equipment.get(gear_key, [])
-        # For special_equipment, get the values (dict -> list of dicts)
-        if gear_key == 'special_equipment' and isinstance(gear_items, dict):
-            gear_items = list(gear_items.values())
-        if gear_items:
-            if gear_title in ['SPECIAL EQUIPMENT', 'ADVENTURING GEAR']:
-                story.append(Paragraph(f"<para align='center'>🎒 {gear_title} 🎒</para>", styles['SectionHeader']))
-            else:
-                story.append(Paragraph(f"🎒 {gear_title} 🎒", styles['SectionHeader']))
-            gear_text_items = []
-            for i, item in enumerate(gear_items):
-                if isinstance(item, dict):
-                    if gear_key == 'unequipped_items':
-                        item_text = f"{item.get('name', 'Unknown')} ({item.get('reason', 'No reason given')})"
-                    else:
-                        item_name = item.get('name', str(item))
-                        lower_name = item_name.lower()
-                        if lower_name in ('ammunition', 'musical instrument'):
-                            specific_type = item.get('type') or item.get('subtype') or item.get('item_type')
-                            if specific_type:
-                                item_name = specific_type.capitalize()
-                        qty = item.get('quantity') or item.get('count')
-                        if qty:
-                            item_text = f"{item_name} (x{qty})"
-                        else:
-                            item_text = item_name
-                    gear_text_items.append(item_text)
-                else:
-                    item_text = str(item)
-                    gear_text_items.append(item_text)
+    char_style = styles['CharacterText']  # Hoisted: every gear line uses it
+    gear = _normalize_gear(equipment)  # Every section as a plain list
+    for gear_key, gear_title, centered in _GEAR_SECTIONS:
+        if gear_items := gear[gear_key]:
+            header = f"🎒 {gear_title} 🎒"
+            story.append(Paragraph(_CENTERED % header if centered else header, styles['SectionHeader']))
+            gear_text_items = [_gear_item_text(item, gear_key) for item in gear_items]
             # Center Brewer's Supplies if under SPECIAL EQUIPMENT
-            if gear_title == 'SPECIAL EQUIPMENT' and any('brewer' in s.lower() for s in gear_text_items):
-                for item_text in gear_text_items:
-                    if 'brewer' in item_text.lower():
-                        story.append(Paragraph(f"<para align='center'>{item_text}</para>", styles['CharacterText']))
-                    else:
-                        story.append(Paragraph(item_text, styles['CharacterText']))
+            if gear_key == 'special_equipment' and any('brewer' in t.lower() for t in gear_text_items):
+                story.extend(
+                    Paragraph(_CENTERED % t if 'brewer' in t.lower() else t, char_style)
+                    for t in gear_text_items
+                )
+            elif len(gear_text_items) <= 3:
+                # Few items fit on one line
+                story.append(Paragraph(" • ".join(gear_text_items), char_style))
             else:
-                # Split into multiple lines if too many items
-                if len(gear_text_items) <= 3:
-                    gear_text = " • ".join(gear_text_items)
-                    story.append(Paragraph(gear_text, styles['CharacterText']))
-                else:
-                    # Show as bullet list for many items
-                    for item_text in gear_text_items:
-                        story.append(Paragraph(f"• {item_text}", styles['CharacterText']))
+                # Show as bullet list for many items
+                story.extend(Paragraph(f"• {t}", char_style) for t in gear_text_items)
             story.append(Spacer(1, 15))
     # === REMAINING FUNDS SECTION ===
     # Show the character's remaining funds in a styled box
@@ -563,43 +645,217 @@ def download_pdf():
     # REMAINING FUNDS SECTION 
     # Center Remaining Funds title
     story.append(Paragraph("<para align='center'>💰 REMAINING FUNDS 💰</para>", styles['SectionHeader']))
-    from .utils.currency_utils import format_coin_display
-    coins_left = session.get('coins_left', {})
+    coins_left = data.get('coins_left', {})
     funds_display = format_coin_display(coins_left) if coins_left else "0 gp"
     
     # Display funds in a nice box
-    funds_table = Table([[funds_display]], colWidths=[4*inch])
-    funds_table.setStyle(TableStyle([
-        ('BACKGROUND', (0,0), (0,0), colors.HexColor('#d4af37')),
-        ('TEXTCOLOR', (0,0), (0,0), colors.HexColor('#2c1810')),
-        ('FONTNAME', (0,0), (0,0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0,0), (0,0), 14),
-        ('ALIGN', (0,0), (0,0), 'CENTER'),
-        ('VALIGN', (0,0), (0,0), 'MIDDLE'),
-        ('BOX', (0,0), (0,0), 2, colors.HexColor('#8b4513')),
-        ('TOPPADDING', (0,0), (0,0), 8),
-        ('BOTTOMPADDING', (0,0), (0,0), 8),
-    ]))
-    story.append(funds_table)
+    story.append(_ColoredLabel(funds_display, 4*inch, 28, _GOLD, _INK,
+                               'Helvetica-Bold', 14, border=_LEATHER, border_width=2))
     story.append(Spacer(1, 30))
     
     # === FOOTER ===
     # Add a decorative footer and credits to the PDF
     # FOOTER 
-    story.append(Paragraph("═" * 80, styles['CharacterText']))
+    story.append(_footer_rule())
     story.append(Spacer(1, 6))
     story.append(Paragraph("Generated by D&D 5E Character Builder", styles['CharacterText']))
     story.append(Paragraph("Adventure awaits! 🗡️🛡️🔮", styles['CharacterText']))
     story.append(Spacer(1, 6))
-    story.append(Paragraph("═" * 80, styles['CharacterText']))
+    story.append(_footer_rule())
     
-    # Build the PDF and send it as a downloadable file
+    # Build the PDF and hand back the finished bytes (the buffer stays with this thread)
     doc.build(story)
-    buffer.seek(0)
+    return buffer.getvalue()
 
-    return send_file(
-        buffer,
+
+# ——— HTTP Caching ———
+# Session keys the sheet is rendered from; the ETag changes whenever any of them does
+_SHEET_KEYS = _NAME_KEYS + (
+    'race', 'class', 'primary_ability', 'adjusted_stats', 'max_hp', 'equipment',
+    'skills_list', 'passive_perception', 'spell_save_dc', 'spell_attack_bonus',
+    'cantrips', 'level1_spells', 'coins_left',
+)
+_REQUIRED_KEYS = ('race', 'class', 'adjusted_stats', 'max_hp')  # Must be present to build a sheet
+_SHEET_VERSION = 1  # Bump when the sheet layout changes so browsers drop PDFs they cached
+
+def _module_digest():
+    # Digest of this module's code, so any change to the rendering code also changes every ETag
+    with open(__file__, 'rb') as source:
+        return hashlib.blake2b(source.read(), digest_size=8).hexdigest()
+
+_RENDER_CODE_DIGEST = _module_digest()
+
+def _sheet_etag(data):
+    """
+    Hash the character fields the sheet is built from.
+    Args:
+        data (Mapping): Character data, as stored in the session
+    Returns:
+        str: 16-hex-digit blake2b digest of the canonical JSON of those fields
+    """
+    relevant = {key: data.get(key) for key in _SHEET_KEYS}
+    relevant['_version'] = _SHEET_VERSION
+    relevant['_code'] = _RENDER_CODE_DIGEST  # PDFs cached by an older build are never served
+    payload = json.dumps(relevant, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+# ——— Render Pool ———
+# With PDF_RENDER_PROCESSES > 0, sheets are built in a process pool so the CPU-bound ReportLab
+# build runs on another core and an async (gevent/eventlet) worker keeps serving other requests.
+# The pool is created lazily in each worker process: executors do not survive a fork.
+_PDF_POOL = None
+_PDF_POOL_LOCK = threading.Lock()
+
+def _pdf_pool(processes):
+    """Return this process's render pool, creating it on first use."""
+    global _PDF_POOL
+    if _PDF_POOL is None:
+        with _PDF_POOL_LOCK:
+            if _PDF_POOL is None:
+                _PDF_POOL = ProcessPoolExecutor(max_workers=processes)
+    return _PDF_POOL
+
+def _render(data):
+    """Render a sheet in the pool if one is configured, otherwise on this thread."""
+    processes = current_app.config.get("PDF_RENDER_PROCESSES", 0)
+    if processes > 0:
+        return _pdf_pool(processes).submit(_render_pdf, data).result()
+    return _render_pdf(data)
+
+# ——— PDF Disk Cache ———
+# Rendered sheets are kept on disk by ETag so a repeat download skips ReportLab entirely.
+# The directory is pruned oldest-first (by last use) once it grows past the size limit.
+# It holds other users' character sheets, so it lives in the app's instance folder by default
+# (app.config["PDF_CACHE_DIR"]) and is only used while it is private to this process's user.
+PDF_CACHE_MAX_BYTES = 200 * 1024 * 1024  # 200 MB
+
+def _cache_dir():
+    """
+    Return the PDF cache directory, creating it (mode 0o700) if needed.
+    Returns:
+        str | None: The directory, or None when it is unusable (caching is then skipped)
+    """
+    directory = current_app.config.get("PDF_CACHE_DIR")
+    if not directory:
+        return None
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        info = os.stat(directory)
+        if info.st_uid != os.getuid():
+            return None  # Someone else's directory: never read or write sheets there
+        if info.st_mode & 0o077:
+            os.chmod(directory, 0o700)  # Ours but readable by others (e.g., created under a loose umask)
+    except OSError:
+        return None
+    return directory
+
+def _cache_path(directory, etag):
+    """Return the cache file path for a sheet's ETag."""
+    return os.path.join(directory, f"{etag}.pdf")
+
+def _store_pdf(directory, etag, pdf_bytes):
+    """
+    Write a rendered sheet into the cache, then prune the cache if it is over the limit.
+    Args:
+        directory (str): The cache directory (from _cache_dir)
+        etag (str): The sheet's ETag (cache key)
+        pdf_bytes (bytes): The rendered PDF
+    A cache directory that is not writable just means no caching.
+    """
+    path = _cache_path(directory, etag)
+    try:
+        # Write to a temp file and rename, so a concurrent reader never sees a partial PDF
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(pdf_bytes)
+        os.replace(tmp_path, path)
+        _prune_cache(directory, keep=path)
+    except OSError:
+        pass
+
+def _prune_cache(directory, keep):
+    """Delete the least recently used cached PDFs (never `keep`) until the cache fits PDF_CACHE_MAX_BYTES."""
+    entries = []
+    total = 0
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.name.endswith(".pdf"):
+                stat = entry.stat()
+                total += stat.st_size
+                if entry.path != keep:
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+    if total <= PDF_CACHE_MAX_BYTES:
+        return
+    for _, size, path in sorted(entries):  # Oldest mtime (least recently used) first
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass  # Another worker already pruned it
+        total -= size
+        if total <= PDF_CACHE_MAX_BYTES:
+            break
+
+def _send_cached_pdf(path, etag):
+    """Send a cached sheet from disk (send_file can use sendfile(2)) with our ETag."""
+    response = send_file(
+        path,
+        mimetype="application/pdf",
         as_attachment=True,
         download_name="character_overview.pdf",
-        mimetype="application/pdf"
+        conditional=True,
+        etag=etag,
+    )
+    response.headers["Cache-Control"] = "private, must-revalidate"  # Per-user data; always revalidate with the ETag
+    return response
+
+@bp.route("/download/pdf")
+def download_pdf():
+    """
+    Generate and send a PDF character sheet based on session data.
+    This function builds a detailed PDF using ReportLab, including all character info, stats, equipment, spells, and more.
+    """
+    # Snapshot the session into a plain dict: every read during the build is then a direct
+    # dict lookup instead of a trip through Flask's session proxy
+    data = dict(session)
+
+    # A sheet without these would print 'None'/'Unknown' placeholders; refuse before doing any work
+    missing = [key for key in _REQUIRED_KEYS if not data.get(key)]
+    if missing:
+        abort(400, description=f"Missing character data: {', '.join(missing)}. Finish creating your character first.")
+
+    # The PDF is a pure function of the character data: if the browser already has this
+    # version, answer 304 without building anything
+    etag = _sheet_etag(data)
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+        response.set_etag(etag)
+        return response
+
+    # Rendered before? Serve it from the disk cache, marking it as recently used
+    cache_dir = _cache_dir()
+    if cache_dir:
+        path = _cache_path(cache_dir, etag)
+        try:
+            os.utime(path)
+            return _send_cached_pdf(path, etag)
+        except FileNotFoundError:
+            pass
+
+    pdf_bytes = _render(data)
+    if cache_dir:
+        _store_pdf(cache_dir, etag, pdf_bytes)  # Kept for the next download; this one is sent from memory
+
+    # ReportLab only writes the document when the build finishes (the xref table needs every
+    # object's offset), so there is nothing to stream early. Send the finished bytes directly
+    # with a known Content-Length.
+    response = Response(
+        pdf_bytes,
+        mimetype="application/pdf",
+        headers={
+            "Content-Disposition": 'attachment; filename="character_overview.pdf"',
+            "Content-Length": str(len(pdf_bytes)),
+            "Cache-Control": "private, must-revalidate",  # Per-user data; always revalidate with the ETag
+        },
     )
+    response.set_etag(etag)
+    return response
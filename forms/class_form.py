@@ -1,10 +1,17 @@
 # dnd_builder/forms/class_form.py
 # This module defines the form for class selection in the character creation process.
 
+from functools import lru_cache
+
 from flask_wtf import FlaskForm
 from wtforms import RadioField, SubmitField
 from wtforms.validators import DataRequired, Optional
 
+@lru_cache(maxsize=16)
+def _class_choices(classes):
+    # (value, label) pairs for a tuple of class names; the same classes list is passed on every request
+    return tuple((c, c) for c in classes)
+
 class ClassForm(FlaskForm):
     # Radio field for selecting the character's class (required)
     class_choice = RadioField("Choose your class", choices=[], validators=[DataRequired()])
@@ -22,4 +29,4 @@ class ClassForm(FlaskForm):
             classes (list): List of available class names (e.g., ['Fighter', 'Wizard', ...])
         """
         super().__init__(*args, **kwargs)
-        self.class_choice.choices = [(c, c) for c in classes]  # Populate class choices dynamically
+        self.class_choice.choices = _class_choices(tuple(classes))  # Populate class choices dynamically
@@ -1,17 +1,142 @@
+from operator import attrgetter
+
 from flask import request
 from flask_wtf import FlaskForm
 from wtforms import SelectMultipleField, SelectField, HiddenField, SubmitField, FormField, FieldList
 from wtforms.validators import DataRequired, ValidationError, Optional
 # Import equipment and utility data for populating form fields and validation
-from ..data.equipment.weapons import WEAPONS
-from ..data.equipment.armor import ARMOR
+from ..data.equipment.weapons import WEAPONS, WEAPON_ROWS
+from ..data.equipment.armor import ARMOR, ARMOR_ROWS
 from ..data.equipment.adventuring_gear import (
     ADVENTURING_GEAR, AMMUNITION_OPTIONS, ARCANE_FOCUS_OPTIONS,
     HOLY_SYMBOL_OPTIONS, MUSICAL_INSTRUMENT_OPTIONS, TOOL_OPTIONS
 )
 from ..data.equipment import has_weapon_proficiency, has_armor_proficiency
+from ..data.spells import wizard_cantrips, wizard_level1_spells, cleric_cantrips, level1_cleric_spells
 from .equipment_categories import SpecialEquipmentForm
 
+def _price_label(gp, sp, cp):
+    # Price shown in the largest coin with a non-zero amount (e.g. '5 gp', '2 sp')
+    return f"{gp} gp" if gp > 0 else f"{sp} sp" if sp > 0 else f"{cp} cp" if cp > 0 else "0 gp"
+
+def _format_cost(cost_dict):
+    # Price label for a cost dictionary
+    return _price_label(cost_dict.get('gp', 0), cost_dict.get('sp', 0), cost_dict.get('cp', 0))
+
+def _row_cost(row):
+    # Price label for an ArmorRow/WeaponRow
+    return _price_label(row.cost_gp, row.cost_sp, row.cost_cp)
+
+def _armor_choices():
+    # Armor choices from the armor rows, skipping shields (handled separately)
+    return (('', '-- Select Armor --'),) + tuple(
+        (f"{row.category}:{row.name}", f"{row.name} (AC {row.ac}) - {_row_cost(row)}")
+        for row in ARMOR_ROWS if row.category != 'shield'
+    )
+
+def _shield_choices():
+    return (('', '-- No Shield --'),) + tuple(
+        (f"shield:{row.name}", f"{row.name} (+{row.ac_bonus} AC) - {_row_cost(row)}")
+        for row in ARMOR_ROWS if row.category == 'shield'
+    )
+
+def _weapon_choices(category):
+    return tuple((f"{row.category}:{row.name}", f"{row.name} ({_row_cost(row)})")
+                 for row in WEAPON_ROWS if row.category == category)
+
+def _option_choices(options, placeholder=None):
+    # (key, 'Name (cost)') choices for a dict of gear options, optionally led by a blank placeholder
+    choices = [(key, f"{item['name']} ({_format_cost(item.get('cost', {}))})") for key, item in options.items()]
+    if placeholder:
+        choices.insert(0, ('', placeholder))
+    return tuple(choices)
+
+# Every choice list except the spell scroll one depends only on the static catalog data,
+# so they are built once at import and shared (as tuples) by every form instance
+_ARMOR_CHOICES = _armor_choices()
+_SHIELD_CHOICES = _shield_choices()
+_WEAPON_CHOICES = {category: _weapon_choices(category) for category in WEAPONS}
+_GEAR_CHOICES = _option_choices(ADVENTURING_GEAR)
+_AMMUNITION_CHOICES = _option_choices(AMMUNITION_OPTIONS, '-- Select Ammunition --')
+_ARCANE_FOCUS_CHOICES = _option_choices(ARCANE_FOCUS_OPTIONS, '-- Select Arcane Focus --')
+_HOLY_SYMBOL_CHOICES = _option_choices(HOLY_SYMBOL_OPTIONS, '-- Select Holy Symbol --')
+_MUSICAL_INSTRUMENT_CHOICES = _option_choices(MUSICAL_INSTRUMENT_OPTIONS, '-- Select Instrument --')
+_TOOL_CHOICES = _option_choices(TOOL_OPTIONS, '-- Select Tool --')
+
+# Spell scroll price in gp by spell level ('0' = cantrip, '1' = 1st level)
+_SPELL_SCROLL_GP = {'0': 30, '1': 50}
+
+def _priced_spell_choices(spells, level):
+    # Spell entries are (key, label) or (key, label, concentration); only the first two are used
+    price = _SPELL_SCROLL_GP[level]
+    return (('', '-- Select Spell --'),) + tuple((spell[0], f"{spell[1]} ({price} gp)") for spell in spells)
+
+# Priced spell scroll choices for each (class, level), built once at import
+_SPELL_CHOICES = {
+    ('wizard', '0'): _priced_spell_choices(wizard_cantrips, '0'),
+    ('wizard', '1'): _priced_spell_choices(wizard_level1_spells, '1'),
+    ('cleric', '0'): _priced_spell_choices(cleric_cantrips, '0'),
+    ('cleric', '1'): _priced_spell_choices(level1_cleric_spells, '1'),
+}
+_NO_SPELL_CHOICES = (('', '-- Select Spell --'),)
+_SPELL_PROMPT_CHOICES = (('', '-- Select class and level, then click "Update Spell List" --'),)
+
+def spell_scroll_choices(spell_class, spell_level):
+    """
+    Return the priced spell choices for a spell scroll.
+    Args:
+        spell_class (str): 'wizard' or 'cleric'
+        spell_level (str): '0' for cantrips; any other level is priced as 1st level
+    Returns:
+        tuple: (spell ID, 'Name (price gp)') choices led by a blank placeholder
+    """
+    level = '0' if spell_level == '0' else '1'
+    return _SPELL_CHOICES.get((spell_class, level), _NO_SPELL_CHOICES)
+
+def _to_gp(cost):
+    """Convert a cost dictionary to gold pieces."""
+    total = 0.0
+    total += cost.get('pp', 0) * 10    # 1 pp = 10 gp
+    total += cost.get('gp', 0)         # 1 gp = 1 gp
+    total += cost.get('sp', 0) / 10    # 10 sp = 1 gp
+    total += cost.get('cp', 0) / 100   # 100 cp = 1 gp
+    return total
+
+# Catalog entries never change, so every selectable item is resolved and priced once here.
+# Choice value -> (kind, category, catalog entry, price in gp). Armor, shields and weapons are
+# keyed by their 'category:name' choice value and adventuring gear by its key, so a submitted
+# value is looked up as-is: no scan of its category list and no split(':').
+_SELECTABLE = {
+    f"{category}:{item['name']}": ('shield' if category == 'shield' else 'armor', category, item, _to_gp(item['cost']))
+    for category, items in ARMOR.items() for item in items if isinstance(item, dict)
+}
+_SELECTABLE.update(
+    (f"{category}:{weapon['name']}", ('weapon', category, weapon, _to_gp(weapon.get('cost', {'gp': 0}))))
+    for category, weapons in WEAPONS.items() for weapon in weapons
+)
+_SELECTABLE.update((key, ('gear', None, item, _to_gp(item['cost']))) for key, item in ADVENTURING_GEAR.items())
+
+def _special_entries(slot, options):
+    # Option key -> (slot, None, option entry, price in gp) for one special equipment slot
+    return {key: (slot, None, item, _to_gp(item['cost'])) for key, item in options.items()}
+
+# Weapon fields, one per WEAPONS category (the field name is the category)
+_WEAPON_FIELDS = ('simple_melee', 'simple_ranged', 'martial_melee', 'martial_ranged')
+
+def _special_slot(has_field, selection_field, slot, options):
+    # (getter returning (checkbox data, selection data) from the subform, option key -> resolved entry)
+    return attrgetter(f"{has_field}.data", f"{selection_field}.data"), _special_entries(slot, options)
+
+# Special equipment slots, in the order they are listed on the character sheet
+_SPECIAL_SLOTS = (
+    _special_slot('has_arcane_focus', 'arcane_focus_selection', 'arcane_focus', ARCANE_FOCUS_OPTIONS),
+    _special_slot('has_holy_symbol', 'holy_symbol_selection', 'holy_symbol', HOLY_SYMBOL_OPTIONS),
+    _special_slot('has_musical_instrument', 'musical_instrument_selection',
+                  'musical_instrument', MUSICAL_INSTRUMENT_OPTIONS),
+    _special_slot('has_tools', 'tool_selection', 'tools', TOOL_OPTIONS),
+    _special_slot('has_ammunition', 'ammunition_selection', 'ammunition', AMMUNITION_OPTIONS),
+)
+
 # EquipmentForm handles all equipment selection for a D&D character
 class EquipmentForm(FlaskForm):
     class Meta:
@@ -27,14 +152,17 @@ class EquipmentForm(FlaskForm):
     # Special equipment (tools, instruments, spell foci, etc.)
     special_equipment = FormField(SpecialEquipmentForm)
     
+    # Multiple-selection fields default to () so an unsubmitted form gets [] as data rather than
+    # None (SelectMultipleField turns a None default into None data)
+    
     # Adventuring gear (multiple selection)
-    adventuring_gear = SelectMultipleField('Adventuring Gear', choices=[], validators=[])
+    adventuring_gear = SelectMultipleField('Adventuring Gear', choices=[], default=(), validators=[])
     
     # Weapon selection fields (multiple selection for each category)
-    simple_melee = SelectMultipleField('Simple Melee Weapons', validators=[])
-    simple_ranged = SelectMultipleField('Simple Ranged Weapons', validators=[])
-    martial_melee = SelectMultipleField('Martial Melee Weapons', validators=[])
-    martial_ranged = SelectMultipleField('Martial Ranged Weapons', validators=[])
+    simple_melee = SelectMultipleField('Simple Melee Weapons', default=(), validators=[])
+    simple_ranged = SelectMultipleField('Simple Ranged Weapons', default=(), validators=[])
+    martial_melee = SelectMultipleField('Martial Melee Weapons', default=(), validators=[])
+    martial_ranged = SelectMultipleField('Martial Ranged Weapons', default=(), validators=[])
     
     # Hidden field to trigger equipment validation
     equipment_check = HiddenField('Equipment Check', validators=[])
@@ -46,250 +174,87 @@ class EquipmentForm(FlaskForm):
         self.remaining_funds = 0
         self.total_cost = 0
         self.validation_errors = []  # Store custom validation errors
+        self._selection = None  # Resolved selections, filled on first use by _selected_items()
+        self._total_gp = None   # Total cost, filled on first use by calculate_total_cost()
         
-        # Ensure all SelectMultipleFields are initialized as empty lists
-        if self.adventuring_gear.data is None:
-            self.adventuring_gear.data = []
-        if self.simple_melee.data is None:
-            self.simple_melee.data = []
-        if self.simple_ranged.data is None:
-            self.simple_ranged.data = []
-        if self.martial_melee.data is None:
-            self.martial_melee.data = []
-        if self.martial_ranged.data is None:
-            self.martial_ranged.data = []
-            
         # Populate all field choices
         self._setup_choices()
     
     def _setup_choices(self):
         """Setup all the choices for form fields."""
-        # Populate armor choices from ARMOR data, skipping shields (handled separately)
-        armor_choices = [('', '-- Select Armor --')]
-        for category, armor_list in ARMOR.items():
-            if category != 'shield':
-                for armor_item in armor_list:
-                    if not isinstance(armor_item, dict):
-                        continue
-                    cost_str = f"{armor_item.get('cost', {}).get('gp', 0)} gp"
-                    if 'cost' in armor_item and 'sp' in armor_item['cost']:
-                        cost_str = f"{armor_item['cost']['sp']} sp"
-                    armor_choices.append((
-                        f"{category}:{armor_item['name']}", 
-                        f"{armor_item['name']} (AC {armor_item['ac']}) - {cost_str}"
-                    ))
-        self.armor.choices = armor_choices
-        
-        # Populate shield choices
-        shield_choices = [('', '-- No Shield --')]
-        if 'shield' in ARMOR:
-            for shield_item in ARMOR['shield']:
-                cost_str = f"{shield_item.get('cost', {}).get('gp', 0)} gp"
-                shield_choices.append((
-                    f"shield:{shield_item['name']}", 
-                    f"{shield_item['name']} (+{shield_item['ac_bonus']} AC) - {cost_str}"
-                ))
-        self.shield.choices = shield_choices
-        
-        # Helper to format weapon choices with price
-        def format_weapon_choice(category, weapon):
-            cost = weapon.get('cost', {})
-            if 'gp' in cost and cost['gp'] > 0:
-                cost_str = f"{cost['gp']} gp"
-            elif 'sp' in cost and cost['sp'] > 0:
-                cost_str = f"{cost['sp']} sp"
-            elif 'cp' in cost and cost['cp'] > 0:
-                cost_str = f"{cost['cp']} cp"
-            else:
-                cost_str = "0 gp"
-            return (f"{category}:{weapon['name']}", f"{weapon['name']} ({cost_str})")
-        
-        # Populate weapon choices for each category
-        self.simple_melee.choices = [format_weapon_choice('simple_melee', weapon) 
-                                   for weapon in WEAPONS['simple_melee']]
-        self.simple_ranged.choices = [format_weapon_choice('simple_ranged', weapon)
-                                    for weapon in WEAPONS['simple_ranged']]
-        self.martial_melee.choices = [format_weapon_choice('martial_melee', weapon)
-                                    for weapon in WEAPONS['martial_melee']]
-        self.martial_ranged.choices = [format_weapon_choice('martial_ranged', weapon)
-                                     for weapon in WEAPONS['martial_ranged']]
-        
-        # Helper to format cost for gear and special items
-        def format_cost(cost_dict):
-            if 'gp' in cost_dict and cost_dict['gp'] > 0:
-                return f"{cost_dict['gp']} gp"
-            elif 'sp' in cost_dict and cost_dict['sp'] > 0:
-                return f"{cost_dict['sp']} sp"
-            elif 'cp' in cost_dict and cost_dict['cp'] > 0:
-                return f"{cost_dict['cp']} cp"
-            else:
-                return "0 gp"
-        
-        # Populate adventuring gear choices
-        gear_choices = [(key, f"{item['name']} ({format_cost(item.get('cost', {}))})") 
-                       for key, item in ADVENTURING_GEAR.items()]
-        self.adventuring_gear.choices = gear_choices
-        
-        # Populate special equipment choices (ammunition, focus, etc.)
-        if hasattr(self.special_equipment, 'ammunition_selection'):
-            self.special_equipment.ammunition_selection.choices = [
-                ('', '-- Select Ammunition --')] + [
-                (key, f"{item['name']} ({format_cost(item.get('cost', {}))})") 
-                for key, item in AMMUNITION_OPTIONS.items()]
-        
-        if hasattr(self.special_equipment, 'arcane_focus_selection'):
-            self.special_equipment.arcane_focus_selection.choices = [
-                ('', '-- Select Arcane Focus --')] + [
-                (key, f"{item['name']} ({format_cost(item.get('cost', {}))})") 
-                for key, item in ARCANE_FOCUS_OPTIONS.items()]
-        
-        if hasattr(self.special_equipment, 'holy_symbol_selection'):
-            self.special_equipment.holy_symbol_selection.choices = [
-                ('', '-- Select Holy Symbol --')] + [
-                (key, f"{item['name']} ({format_cost(item.get('cost', {}))})") 
-                for key, item in HOLY_SYMBOL_OPTIONS.items()]
+        # Catalog-derived choice lists are built once at import; only share them here
+        self.armor.choices = _ARMOR_CHOICES
+        self.shield.choices = _SHIELD_CHOICES
+        self.simple_melee.choices = _WEAPON_CHOICES['simple_melee']
+        self.simple_ranged.choices = _WEAPON_CHOICES['simple_ranged']
+        self.martial_melee.choices = _WEAPON_CHOICES['martial_melee']
+        self.martial_ranged.choices = _WEAPON_CHOICES['martial_ranged']
+        self.adventuring_gear.choices = _GEAR_CHOICES
         
-        if hasattr(self.special_equipment, 'musical_instrument_selection'):
-            self.special_equipment.musical_instrument_selection.choices = [
-                ('', '-- Select Instrument --')] + [
-                (key, f"{item['name']} ({format_cost(item.get('cost', {}))})") 
-                for key, item in MUSICAL_INSTRUMENT_OPTIONS.items()]
+        # Populate special equipment choices (ammunition, focus, etc.); SpecialEquipmentForm
+        # declares every one of these fields, so they are assigned directly
+        special = self.special_equipment
+        special.ammunition_selection.choices = _AMMUNITION_CHOICES
+        special.arcane_focus_selection.choices = _ARCANE_FOCUS_CHOICES
+        special.holy_symbol_selection.choices = _HOLY_SYMBOL_CHOICES
+        special.musical_instrument_selection.choices = _MUSICAL_INSTRUMENT_CHOICES
+        special.tool_selection.choices = _TOOL_CHOICES
         
-        if hasattr(self.special_equipment, 'tool_selection'):
-            self.special_equipment.tool_selection.choices = [
-                ('', '-- Select Tool --')] + [
-                (key, f"{item['name']} ({format_cost(item.get('cost', {}))})") 
-                for key, item in TOOL_OPTIONS.items()]
+        # Spell scroll choices depend on the chosen class and level
+        spell_class = special.spell_scroll_class.data
+        spell_level = special.spell_scroll_level.data
+        if not spell_class and not spell_level:
+            # Fresh form (no data): show a helpful message
+            special.spell_selection.choices = _SPELL_PROMPT_CHOICES
+        else:
+            special.spell_selection.choices = spell_scroll_choices(spell_class or 'wizard', spell_level or '0')
+
+    def _selected_items(self):
+        """
+        Resolve every selected catalog item, once per form.
+        Both the total cost and selected_equipment are built from this list.
+        Returns:
+            list: (kind, category, item, cost in gp) tuples; kind is 'armor', 'shield', 'weapon',
+                  'gear' or a special equipment key such as 'arcane_focus'
+        """
+        if self._selection is not None:
+            return self._selection
+        # Every select-field value in one flat list: armor, shield, then each weapon field
+        selections = [self.armor.data, self.shield.data]
+        for field_name in _WEAPON_FIELDS:
+            selections.extend(getattr(self, field_name).data)
+        items = [_SELECTABLE[value] for value in selections if value in _SELECTABLE]
         
-        # Populate spell scroll choices based on selected class and level
-        from ..data.spells import (wizard_cantrips, wizard_level1_spells,
-                                 cleric_cantrips, level1_cleric_spells)
+        # Special equipment (checkbox ticked and an option chosen)
+        if self.special_equipment:
+            for get_fields, entries in _SPECIAL_SLOTS:
+                has_item, selection = get_fields(self.special_equipment)
+                if has_item and selection in entries:
+                    items.append(entries[selection])
         
-        def get_spell_choices(spell_class, level):
-            if spell_class == 'wizard':
-                return wizard_cantrips if level == '0' else wizard_level1_spells
-            elif spell_class == 'cleric':
-                if level == '0':
-                    # Cleric cantrips have 3 elements, so extract just the first 2
-                    return [(spell[0], spell[1]) for spell in cleric_cantrips]
-                else:
-                    return level1_cleric_spells
-            return []
+        # Adventuring gear
+        items.extend(_SELECTABLE[item_id] for item_id in self.adventuring_gear.data if item_id in ADVENTURING_GEAR)
         
-        if hasattr(self.special_equipment, 'spell_selection'):
-            # Get current selections or use defaults
-            spell_class = getattr(self.special_equipment.spell_scroll_class, 'data', None) or 'wizard'
-            spell_level = getattr(self.special_equipment.spell_scroll_level, 'data', None) or '0'
-            
-            # If it's a fresh form (no data), show a helpful message
-            if not self.special_equipment.spell_scroll_class.data and not self.special_equipment.spell_scroll_level.data:
-                self.special_equipment.spell_selection.choices = [
-                    ('', '-- Select class and level, then click "Update Spell List" --')
-                ]
-            else:
-                spell_list = get_spell_choices(spell_class, spell_level)
-                # Add pricing to spell choices
-                spell_price = 30 if spell_level == '0' else 50  # 30gp for cantrips, 50gp for 1st level
-                try:
-                    self.special_equipment.spell_selection.choices = [('', '-- Select Spell --')] + [
-                        (spell_key, f"{spell_name} ({spell_price} gp)") for spell_key, spell_name in spell_list
-                    ]
-                except ValueError:
-                    # Fallback to empty selection
-                    self.special_equipment.spell_selection.choices = [
-                        ('', '-- Error loading spells, please try again --')
-                    ]
+        self._selection = items
+        return items
 
     def calculate_total_cost(self):
-        """Calculate the total cost of all selected equipment in gold pieces."""
+        """
+        Calculate the total cost of all selected equipment in gold pieces.
+        Computed once per form: validate(), selected_equipment and the route all ask for it.
+        """
+        if self._total_gp is not None:
+            return self._total_gp
         total_gp = 0.0
+        for _, _, _, cost_gp in self._selected_items():
+            total_gp += cost_gp
         
-        # Add armor cost if selected
-        if self.armor.data:
-            armor_type, armor_name = self.armor.data.split(':')
-            for armor in ARMOR[armor_type]:
-                if armor['name'] == armor_name:
-                    total_gp += self._convert_to_gp(armor['cost'])
-                    break
-        
-        # Add shield cost if selected
-        if self.shield.data:
-            shield_type, shield_name = self.shield.data.split(':')
-            for shield in ARMOR[shield_type]:
-                if shield['name'] == shield_name:
-                    total_gp += self._convert_to_gp(shield['cost'])
-                    break
-        
-        # Add costs for selected weapons
-        for weapon_type in [self.simple_melee, self.simple_ranged, 
-                          self.martial_melee, self.martial_ranged]:
-            for weapon_id in weapon_type.data:
-                weapon_category, weapon_name = weapon_id.split(':')
-                for weapon in WEAPONS[weapon_category]:
-                    if weapon['name'] == weapon_name:
-                        total_gp += self._convert_to_gp(weapon.get('cost', {'gp': 0}))
-                        break
-        
-        # Add costs for special equipment
-        if self.special_equipment:
-            # Arcane Focus
-            if (self.special_equipment.has_arcane_focus.data and 
-                self.special_equipment.arcane_focus_selection.data):
-                selection = self.special_equipment.arcane_focus_selection.data
-                if selection in ARCANE_FOCUS_OPTIONS:
-                    total_gp += self._convert_to_gp(ARCANE_FOCUS_OPTIONS[selection]['cost'])
-            
-            # Holy Symbol
-            if (self.special_equipment.has_holy_symbol.data and 
-                self.special_equipment.holy_symbol_selection.data):
-                selection = self.special_equipment.holy_symbol_selection.data
-                if selection in HOLY_SYMBOL_OPTIONS:
-                    total_gp += self._convert_to_gp(HOLY_SYMBOL_OPTIONS[selection]['cost'])
-            
-            # Ammunition
-            if (self.special_equipment.has_ammunition.data and 
-                self.special_equipment.ammunition_selection.data):
-                selection = self.special_equipment.ammunition_selection.data
-                if selection in AMMUNITION_OPTIONS:
-                    total_gp += self._convert_to_gp(AMMUNITION_OPTIONS[selection]['cost'])
-            
-            # Musical Instrument
-            if (self.special_equipment.has_musical_instrument.data and 
-                self.special_equipment.musical_instrument_selection.data):
-                selection = self.special_equipment.musical_instrument_selection.data
-                if selection in MUSICAL_INSTRUMENT_OPTIONS:
-                    total_gp += self._convert_to_gp(MUSICAL_INSTRUMENT_OPTIONS[selection]['cost'])
-            
-            # Tools
-            if (self.special_equipment.has_tools.data and 
-                self.special_equipment.tool_selection.data):
-                selection = self.special_equipment.tool_selection.data
-                if selection in TOOL_OPTIONS:
-                    total_gp += self._convert_to_gp(TOOL_OPTIONS[selection]['cost'])
-            
-            # Spell Scroll
-            if self.special_equipment.has_spell_scroll.data:
-                level = self.special_equipment.spell_scroll_level.data
-                if level == '0':
-                    total_gp += 30  # 30gp for cantrip
-                elif level == '1':
-                    total_gp += 50  # 50gp for 1st level
-        
-        # Add costs for adventuring gear
-        for item_id in self.adventuring_gear.data:
-            if item_id in ADVENTURING_GEAR:
-                total_gp += self._convert_to_gp(ADVENTURING_GEAR[item_id]['cost'])
+        # Spell scrolls are priced by spell level rather than taken from the catalog
+        if self.special_equipment and self.special_equipment.has_spell_scroll.data:
+            total_gp += _SPELL_SCROLL_GP.get(self.special_equipment.spell_scroll_level.data, 0)
         
+        self._total_gp = total_gp
         return total_gp
-    
-    def _convert_to_gp(self, cost):
-        """Convert a cost dictionary to gold pieces."""
-        total = 0.0
-        total += cost.get('pp', 0) * 10    # 1 pp = 10 gp
-        total += cost.get('gp', 0)         # 1 gp = 1 gp
-        total += cost.get('sp', 0) / 10    # 10 sp = 1 gp
-        total += cost.get('cp', 0) / 100   # 100 cp = 1 gp
-        return total
 
     def validate(self):
         """Validate the selected equipment against budget and class restrictions."""
@@ -301,13 +266,15 @@ class EquipmentForm(FlaskForm):
         total_cost = self.calculate_total_cost()
         try:
             budget = float(self.budget.data)
-            # Calculate remaining funds
+            # Store calculated values (read by the route even when a check below fails)
             self.remaining_funds = budget - total_cost
             self.total_cost = total_cost
 
             # Check armor proficiency
             if self.armor.data:
-                armor_type, armor_name = self.armor.data.split(':')
+                # The category is stored with the resolved entry; split only unknown values
+                entry = _SELECTABLE.get(self.armor.data)
+                armor_type = entry[1] if entry else self.armor.data.split(':')[0]
                 if not has_armor_proficiency(self.char_class, armor_type):
                     self.validation_errors.append(f'{self.char_class}s are not proficient with {armor_type} armor')
                     return False
@@ -324,10 +291,6 @@ class EquipmentForm(FlaskForm):
                     self.validation_errors.append('Clerics cannot use Arcane Focus items')
                     return False
             
-            # Store calculated values
-            self.total_cost = total_cost
-            self.remaining_funds = budget - total_cost
-            
             # For purchase, validate against budget
             action = request.form.get('action', '')
             if action == 'purchase' and total_cost > budget:
@@ -350,118 +313,52 @@ class EquipmentForm(FlaskForm):
             'total_cost_gp': self.calculate_total_cost()
         }
 
-        # Process armor selection
-        if self.armor.data:
-            category, name = self.armor.data.split(':')
-            armor = next((a for a in ARMOR[category] if a['name'] == name), None)
-            if armor:
+        # Sort the resolved selections into their sheet sections
+        for kind, category, item, _ in self._selected_items():
+            if kind == 'armor':
                 equipment['armor'] = {
-                    'name': armor['name'],
+                    'name': item['name'],
                     'type': category,
-                    'ac': armor['ac'],
-                    'add_dex': armor['add_dex'],
-                    'max_dex': armor['max_dex'],
-                    'cost': armor['cost'],
-                    'stealth_disadvantage': armor['stealth_disadvantage']
+                    'ac': item['ac'],
+                    'add_dex': item['add_dex'],
+                    'max_dex': item['max_dex'],
+                    'cost': item['cost'],
+                    'stealth_disadvantage': item['stealth_disadvantage']
                 }
-
-        # Process shield selection
-        if self.shield.data:
-            category, name = self.shield.data.split(':')
-            shield = next((s for s in ARMOR[category] if s['name'] == name), None)
-            if shield:
+            elif kind == 'shield':
                 equipment['shield'] = {
-                    'name': shield['name'],
-                    'ac_bonus': shield['ac_bonus'],
-                    'cost': shield['cost']
+                    'name': item['name'],
+                    'ac_bonus': item['ac_bonus'],
+                    'cost': item['cost']
                 }
-
-        # Process weapon selections
-        for category in ['simple_melee', 'simple_ranged', 'martial_melee', 'martial_ranged']:
-            field = getattr(self, category)
-            for selection in field.data:
-                if selection:
-                    cat, name = selection.split(':')
-                    weapon = next((w for w in WEAPONS[cat] if w['name'] == name), None)
-                    if weapon:
-                        equipment['weapons'].append({
-                            'name': weapon['name'],
-                            'category': cat,
-                            'damage': weapon['damage'],
-                            'damage_type': weapon['damage_type'],
-                            'properties': weapon['properties'],
-                            'cost': weapon['cost']
-                        })
-
-        # Process adventuring gear selections
-        for gear_id in self.adventuring_gear.data:
-            if gear_id in ADVENTURING_GEAR:
-                gear_item = ADVENTURING_GEAR[gear_id]
+            elif kind == 'weapon':
+                equipment['weapons'].append({
+                    'name': item['name'],
+                    'category': category,
+                    'damage': item['damage'],
+                    'damage_type': item['damage_type'],
+                    'properties': item['properties'],
+                    'cost': item['cost']
+                })
+            elif kind == 'gear':
                 equipment['adventuring_gear'].append({
-                    'name': gear_item['name'],
-                    'cost': gear_item['cost']
+                    'name': item['name'],
+                    'cost': item['cost']
                 })
+            else:
+                # Special equipment slot (arcane focus, holy symbol, instrument, tools, ammunition)
+                equipment['special_equipment'][kind] = {
+                    'name': item['name'],
+                    'cost': item['cost']
+                }
 
-        # Process special equipment selections
+        # Process the spell scroll selection
         if self.special_equipment:
             spec_eq = self.special_equipment
             
-            # Arcane Focus
-            if spec_eq.has_arcane_focus.data and spec_eq.arcane_focus_selection.data:
-                selection = spec_eq.arcane_focus_selection.data
-                if selection in ARCANE_FOCUS_OPTIONS:
-                    equipment['special_equipment']['arcane_focus'] = {
-                        'name': ARCANE_FOCUS_OPTIONS[selection]['name'],
-                        'cost': ARCANE_FOCUS_OPTIONS[selection]['cost']
-                    }
-            
-            # Holy Symbol
-            if spec_eq.has_holy_symbol.data and spec_eq.holy_symbol_selection.data:
-                selection = spec_eq.holy_symbol_selection.data
-                if selection in HOLY_SYMBOL_OPTIONS:
-                    # Add selected holy symbol to special equipment if chosen
-                    equipment['special_equipment']['holy_symbol'] = {
-                        'name': HOLY_SYMBOL_OPTIONS[selection]['name'],  # Name of the holy symbol
-                        'cost': HOLY_SYMBOL_OPTIONS[selection]['cost']   # Cost of the holy symbol
-                    }
-            
-            # Musical Instrument
-            # If a musical instrument is required and selected, add it
-            if spec_eq.has_musical_instrument.data and spec_eq.musical_instrument_selection.data:
-                selection = spec_eq.musical_instrument_selection.data
-                if selection in MUSICAL_INSTRUMENT_OPTIONS:
-                    equipment['special_equipment']['musical_instrument'] = {
-                        'name': MUSICAL_INSTRUMENT_OPTIONS[selection]['name'],  # Name of the instrument
-                        'cost': MUSICAL_INSTRUMENT_OPTIONS[selection]['cost']   # Cost of the instrument
-                    }
-            
-            # Tools
-            # If tools are required and selected, add them
-            if spec_eq.has_tools.data and spec_eq.tool_selection.data:
-                selection = spec_eq.tool_selection.data
-                if selection in TOOL_OPTIONS:
-                    equipment['special_equipment']['tools'] = {
-                        'name': TOOL_OPTIONS[selection]['name'],  # Name of the tool
-                        'cost': TOOL_OPTIONS[selection]['cost']   # Cost of the tool
-                    }
-            
-            # Ammunition
-            # If ammunition is required and selected, add it
-            if spec_eq.has_ammunition.data and spec_eq.ammunition_selection.data:
-                selection = spec_eq.ammunition_selection.data
-                if selection in AMMUNITION_OPTIONS:
-                    equipment['special_equipment']['ammunition'] = {
-                        'name': AMMUNITION_OPTIONS[selection]['name'],  # Name of the ammunition
-                        'cost': AMMUNITION_OPTIONS[selection]['cost']   # Cost of the ammunition
-                    }
-            
             # Spell Scroll
             # If a spell scroll is required and a spell is selected, add it
             if spec_eq.has_spell_scroll.data and spec_eq.spell_selection.data:
-                # Import spell lists for wizard and cleric
-                from ..data.spells import (wizard_cantrips, wizard_level1_spells,
-                                         cleric_cantrips, level1_cleric_spells)
-                
                 # Determine spell class (wizard/cleric), level (cantrip/1st), and selected spell ID
                 spell_class = spec_eq.spell_scroll_class.data or 'wizard'
                 spell_level = spec_eq.spell_scroll_level.data or '0'
@@ -485,7 +382,7 @@ class EquipmentForm(FlaskForm):
                 
                 # Set spell type and cost based on level
                 spell_type = "Cantrip" if spell_level == '0' else "1st Level Spell"
-                scroll_cost = 30 if spell_level == '0' else 50
+                scroll_cost = _SPELL_SCROLL_GP['0' if spell_level == '0' else '1']
                 
                 # Add the spell scroll to special equipment
                 equipment['special_equipment']['spell_scroll'] = {
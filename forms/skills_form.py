@@ -49,14 +49,18 @@ class SkillsForm(FlaskForm):
     
     # Custom validator for the expertise field (Rogues only)
     def validate_expertise(self, field):
-        if self.char_class == 'Rogue':
-            # Rogues must pick exactly 2 skills for Expertise
-            if len(field.data or []) != 2:
-                raise ValidationError("Rogues must choose exactly 2 skills for Expertise.")
-            # Ensure expertise skills are among the selected proficiencies
-            for skill in field.data or []:
-                if skill not in (self.skills.data or []):
-                    raise ValidationError("You can only choose Expertise in skills you're proficient with.")
+        # Only Rogues get Expertise; other classes skip the field entirely
+        if self.char_class != 'Rogue':
+            return
+        expertise = field.data or ()
+        # Rogues must pick exactly 2 skills for Expertise
+        if len(expertise) != 2:
+            raise ValidationError("Rogues must choose exactly 2 skills for Expertise.")
+        # Ensure expertise skills are among the selected proficiencies (one set, built once)
+        selected = set(self.skills.data or ())
+        for skill in expertise:
+            if skill not in selected:
+                raise ValidationError("You can only choose Expertise in skills you're proficient with.")
 
 # This form is used in the character creation process to enforce D&D rules for skill selection.
 # The logic ensures that only valid skill and expertise choices are accepted, with special handling for Rogues.
@@ -7,11 +7,17 @@
 #
 # ——— Imports ———
 from werkzeug.security import generate_password_hash, check_password_hash  # For password hashing and checking
-from .. import db  # Import the SQLAlchemy database instance
-from ..models import User  # Import base User model (if using app factory pattern)
+from . import db  # Import the package-level SQLAlchemy database instance
 
-# UserMixin provides default implementations for Flask-Login user methods
-class User(UserMixin, db.Model):
+# ——— Password Hashing ———
+# Werkzeug method string "scrypt:N:r:p". N (the CPU/memory cost) dominates how long a login takes,
+# so tune it after timing check_password_hash on the production CPU.
+# Changing it is safe: generate_password_hash embeds the method and parameters in each stored hash,
+# and check_password_hash reads them back, so existing hashes keep verifying; new ones use the new cost.
+PASSWORD_HASH_METHOD = "scrypt:32768:8:1"
+
+# User account model (plain SQLAlchemy; the app does not use Flask-Login, so there is no UserMixin)
+class User(db.Model):
     # Unique integer ID for each user (primary key)
     id = db.Column(db.Integer, primary_key=True)
     # User's email address (must be unique and not null)
@@ -21,10 +27,10 @@ class User(UserMixin, db.Model):
 
     def set_password(self, password):
         """
-        Hash and store the user's password using scrypt.
+        Hash and store the user's password using PASSWORD_HASH_METHOD.
         This method takes a plaintext password, hashes it securely, and stores the hash.
         """
-        self.password_hash = generate_password_hash(password, method="scrypt")
+        self.password_hash = generate_password_hash(password, method=PASSWORD_HASH_METHOD)
 
     def check_password(self, password):
         """
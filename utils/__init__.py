@@ -1,9 +1,26 @@
-from .spell_utils import calc_spell_save_dc, calc_spell_attack_bonus  # Import spellcasting utility functions
-from .armor_utils import calculate_ac  # Import armor class calculation utility
+from importlib import import_module
 
 # __all__ defines the public API of this package when using 'from ... import *'
 __all__ = [
     'calc_spell_save_dc',           # Export spell save DC calculation
     'calc_spell_attack_bonus',      # Export spell attack bonus calculation
     'calculate_ac'                  # Export armor class calculation
-]
\ No newline at end of file
+]
+
+# Submodule that defines each exported name. Submodules are imported on first access (PEP 562),
+# so importing one utility (e.g., currency_utils) doesn't load the others.
+_LAZY_EXPORTS = {
+    'calc_spell_save_dc': '.spell_utils',       # Spellcasting utility functions
+    'calc_spell_attack_bonus': '.spell_utils',
+    'calculate_ac': '.armor_utils',             # Armor class calculation utility
+}
+
+def __getattr__(name):
+    # Only called for names not yet in the module globals
+    try:
+        module = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
@@ -1,6 +1,12 @@
 # dnd_builder/utils/armor_utils.py
 # Utility functions for calculating Armor Class (AC) in the D&D character builder.
 
+from operator import itemgetter
+
+# Field readers for armor and shield dicts
+_armor_fields = itemgetter('ac', 'add_dex')
+_shield_bonus = itemgetter('ac_bonus')
+
 def calculate_ac(armor=None, shield=None, dex_modifier=0):
     """Calculate Armor Class based on armor, shield, and dexterity modifier.
     
@@ -18,14 +24,15 @@ def calculate_ac(armor=None, shield=None, dex_modifier=0):
         # No armor - use base AC + full dex modifier
         return base_ac + dex_modifier
         
-    # Start with the armor's base AC
-    total_ac = armor['ac']
+    # Start with the armor's base AC (both fields read in one C-level call)
+    total_ac, add_dex = _armor_fields(armor)
     
     # Add dexterity modifier based on armor type
-    if armor['add_dex']:
-        if armor['max_dex'] is not None:
+    if add_dex:
+        max_dex = armor.get('max_dex')  # Only light/medium armor needs it; heavy entries may omit it
+        if max_dex is not None:
             # Medium armor - cap dex bonus
-            dex_bonus = min(dex_modifier, armor['max_dex'])
+            dex_bonus = min(dex_modifier, max_dex)
         else:
             # Light armor - full dex bonus
             dex_bonus = dex_modifier
@@ -34,9 +41,9 @@ def calculate_ac(armor=None, shield=None, dex_modifier=0):
     
     # Add shield bonus if equipped
     if shield:
-        total_ac += shield['ac_bonus']
+        total_ac += _shield_bonus(shield)
         
     return total_ac
 
-# This function is used to compute a character's AC for display, validation, and PDF output.
+# These functions are used to compute AC for display, validation, and PDF output.
 # It handles all armor types, shield bonuses, and dexterity rules per D&D 5e.
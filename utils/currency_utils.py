@@ -2,6 +2,15 @@
 # Utility functions for converting and formatting D&D currency denominations.
 # Handles conversion between copper, silver, gold, and platinum pieces.
 
+def _split_cp(total_cp):
+    """
+    Split an integer number of copper pieces into (pp, gp, sp, cp).
+    Shared by the converters below; callers that don't need a dictionary can use the tuple directly.
+    """
+    pp, remainder = total_cp // 1000, total_cp % 1000   # 1 pp = 1000 cp
+    gp, remainder = remainder // 100, remainder % 100   # 1 gp = 100 cp
+    return pp, gp, remainder // 10, remainder % 10      # 1 sp = 10 cp
+
 def convert_to_coins(total_cp):
     """
     Convert a total number of copper pieces into appropriate coin denominations.
@@ -9,17 +18,8 @@ def convert_to_coins(total_cp):
     1 pp = 10 gp = 100 sp = 1000 cp
     """
     # Ensure we're working with integers
-    total_cp = int(total_cp)
-    coins = {'pp': 0, 'gp': 0, 'sp': 0, 'cp': 0}
-    
-    # Convert to platinum first
-    coins['pp'], remainder = divmod(total_cp, 1000)
-    # Convert remainder to gold
-    coins['gp'], remainder = divmod(remainder, 100)
-    # Convert remainder to silver
-    coins['sp'], coins['cp'] = divmod(remainder, 10)
-    
-    return coins
+    pp, gp, sp, cp = _split_cp(int(total_cp))
+    return {'pp': pp, 'gp': gp, 'sp': sp, 'cp': cp}
 
 def convert_gp_to_coins(total_gp):
     """
@@ -27,25 +27,12 @@ def convert_gp_to_coins(total_gp):
     Returns a dictionary with the number of each type of coin.
     1 pp = 10 gp, 1 gp = 10 sp, 1 sp = 10 cp
     """
-    coins = {'pp': 0, 'gp': 0, 'sp': 0, 'cp': 0}
-    
-    # Convert to platinum first (10 gp = 1 pp)
-    coins['pp'] = int(total_gp // 10)
-    remainder_gp = total_gp % 10
-    
-    # Convert remainder to gold
-    coins['gp'] = int(remainder_gp)
-    fractional_gp = remainder_gp - coins['gp']
-    
-    # Convert fractional gold to silver (1 gp = 10 sp)
-    total_sp = fractional_gp * 10
-    coins['sp'] = int(total_sp)
-    fractional_sp = total_sp - coins['sp']
-    
-    # Convert fractional silver to copper (1 sp = 10 cp)
-    coins['cp'] = int(fractional_sp * 10)
-    
-    return coins
+    # Round to whole copper once, then split with integer math (no float drift, e.g. 0.3 gp -> 3 sp, not 2 sp 9 cp)
+    pp, gp, sp, cp = _split_cp(round(total_gp * 100))
+    return {'pp': pp, 'gp': gp, 'sp': sp, 'cp': cp}
+
+# Denominations in display order, largest first
+_DENOMINATIONS = ('pp', 'gp', 'sp', 'cp')
 
 def format_coin_display(coins):
     """
@@ -53,15 +40,9 @@ def format_coin_display(coins):
     Only includes denominations that have a value.
     Handles missing denominations gracefully.
     """
-    parts = []
-    if coins.get('pp', 0) > 0:
-        parts.append(f"{int(coins['pp'])} pp")
-    if coins.get('gp', 0) > 0:
-        parts.append(f"{int(coins['gp'])} gp")
-    if coins.get('sp', 0) > 0:
-        parts.append(f"{int(coins['sp'])} sp")
-    if coins.get('cp', 0) > 0:
-        parts.append(f"{int(coins['cp'])} cp")
+    get = coins.get
+    parts = ['%d %s' % (value, denomination)
+             for denomination in _DENOMINATIONS if (value := get(denomination, 0)) > 0]
     return ", ".join(parts) if parts else "0 cp"
 
 def get_cost_in_cp(cost_dict):
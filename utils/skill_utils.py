@@ -17,22 +17,26 @@ def calculate_skill_modifier(ability_score: int, is_proficient: bool, prof_bonus
     is_proficient: Whether the character is proficient in this skill
     prof_bonus: Proficiency bonus (default +2 for level 1)
     """
-    ability_mod = calculate_ability_modifier(ability_score)
-    return ability_mod + (prof_bonus if is_proficient else 0)
+    # Ability modifier inlined (same formula as calculate_ability_modifier) to save a nested call
+    return (ability_score - 10) // 2 + (prof_bonus if is_proficient else 0)
 
-def calculate_passive_perception(wisdom_score: int, perception_proficient: bool) -> int:
+def calculate_passive_perception(wisdom_score: int, perception_proficient: bool, prof_bonus: int = 2) -> int:
     """
     Calculate passive perception score.
     Formula: 10 + Wisdom modifier + (proficiency bonus if proficient in Perception)
     Args:
         wisdom_score (int): The character's Wisdom score
         perception_proficient (bool): Whether the character is proficient in Perception
+        prof_bonus (int): Proficiency bonus (default +2 for level 1)
     Returns:
         int: The passive perception value
     """
-    wisdom_mod = calculate_ability_modifier(wisdom_score)
-    prof_bonus = 2  # Level 1 proficiency bonus
-    perception_mod = calculate_skill_modifier(wisdom_score, perception_proficient, prof_bonus)
-    return 10 + perception_mod
+    return 10 + (wisdom_score - 10) // 2 + (prof_bonus if perception_proficient else 0)
+
+# ——— Many scores at once ———
+
+def calculate_ability_modifiers(scores):
+    """Return the ability modifier for each score, in input order (e.g., all six abilities)."""
+    return [(score - 10) // 2 for score in scores]
 
 # These functions are used to compute skill bonuses, ability modifiers, and passive perception for display and validation.